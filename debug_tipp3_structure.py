@@ -5,7 +5,7 @@ import asyncio
 import sys
 import re
 from pathlib import Path
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from loguru import logger
 
 # Add the src directory to Python path
@@ -13,6 +13,13 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from scrapers.tipp3_fixed_scraper import Tipp3FixedScraper
 
+# Precompiled match patterns; bs4 tests class patterns against each class of a tag
+_EVENT_HREF_RE = re.compile(r'^(?=.*eventdetails)(?=.*eventID=)')
+_PLAYER_CLASS_RE = re.compile(r'^t3-list-entry__player$')
+
+# Saved pages are only analyzed for links, so only <a> tags are built
+_LINK_STRAINER = SoupStrainer('a')
+
 
 async def debug_tipp3_structure():
     """Debug the tipp3 HTML structure to understand why events are not being parsed"""
@@ -41,7 +48,7 @@ async def debug_tipp3_structure():
         soup = BeautifulSoup(content, 'html.parser')
         
         # Find all links containing 'eventdetails' and 'eventID='
-        event_links = soup.find_all('a', href=lambda x: x and 'eventdetails' in x and 'eventID=' in x)
+        event_links = soup.find_all('a', href=_EVENT_HREF_RE)
         logger.info(f"Found {len(event_links)} event detail links")
         
         # Analyze the first few event links in detail
@@ -74,7 +81,7 @@ async def debug_tipp3_structure():
                 logger.info("❌ Not a player/team link")
         
         # Look for all elements with t3-list-entry__player class
-        player_links = soup.find_all('a', class_=lambda x: x and 't3-list-entry__player' in ' '.join(x))
+        player_links = soup.find_all('a', class_=_PLAYER_CLASS_RE)
         logger.info(f"\\n🎯 Found {len(player_links)} links with 't3-list-entry__player' class")
         
         for i, link in enumerate(player_links[:5]):
@@ -168,17 +175,17 @@ async def analyze_saved_html():
         if Path(html_file).exists():
             logger.info(f"\\n📄 Analyzing {html_file}...")
             
-            with open(html_file, 'r', encoding='utf-8') as f:
+            with open(html_file, 'rb') as f:
                 content = f.read()
             
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml', parse_only=_LINK_STRAINER)
             
             # Event detail links
-            event_links = soup.find_all('a', href=lambda x: x and 'eventdetails' in x and 'eventID=' in x)
+            event_links = soup.find_all('a', href=_EVENT_HREF_RE)
             logger.info(f"Event detail links: {len(event_links)}")
             
             # Player links
-            player_links = soup.find_all('a', class_=lambda x: x and 't3-list-entry__player' in ' '.join(x))
+            player_links = soup.find_all('a', class_=_PLAYER_CLASS_RE)
             logger.info(f"Player links: {len(player_links)}")
             
             # Check if player links contain eventdetails
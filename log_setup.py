@@ -0,0 +1,16 @@
+"""
+Shared loguru setup for the test scripts, applied from their __main__ blocks only
+"""
+import sys
+from loguru import logger
+
+# Console line format used by every test script
+_CONSOLE_FORMAT = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}"
+
+
+def configure_logging(level: str = "INFO", file: str = None):
+    """Replace the default sink with the console format and optionally add a rotating log file"""
+    logger.remove()
+    logger.add(sys.stderr, level=level, format=_CONSOLE_FORMAT)
+    if file:
+        logger.add(file, rotation="1 day", retention="1 week", level=level)
@@ -0,0 +1,81 @@
+"""
+Market schema and report helpers for the odds records of the tipp3 scrapers, shared by the test scripts
+"""
+from collections import Counter
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Tuple
+from loguru import logger
+
+# (label, outcome names, odds record keys) of every market we store, in report order. Keys match the
+# enhanced scraper's dict records; ScrapedOdds declares no O/U 1.5 or 4.5 fields (over_15/under_15,
+# over_45/under_45 exist only in those dicts)
+MARKETS: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...] = (
+    ("1X2", ("1", "X", "2"), ("home_odds", "draw_odds", "away_odds")),
+    ("BTTS", ("Yes", "No"), ("btts_yes", "btts_no")),
+    ("O/U 1.5", ("Over", "Under"), ("over_15", "under_15")),
+    ("O/U 2.5", ("Over", "Under"), ("over_25", "under_25")),
+    ("O/U 3.5", ("Over", "Under"), ("over_35", "under_35")),
+    ("O/U 4.5", ("Over", "Under"), ("over_45", "under_45")),
+)
+
+
+def format_market(outcomes: Tuple[str, ...], values: Iterable[Any]) -> str:
+    """Format a market's odds as 'Over 1.8, Under 2.0'"""
+    return ", ".join(f"{outcome} {value}" for outcome, value in zip(outcomes, values))
+
+
+def count_markets(records: Iterable[Dict[str, Any]]) -> Counter:
+    """Count the records that have complete odds for each market (plus correct scores)"""
+    counts = Counter()
+    for record in records:
+        odds = record.get('odds', {})
+        for label, _, keys in MARKETS:
+            counts[label] += all(odds.get(key) for key in keys)
+        counts['Correct Score'] += bool(odds.get('exact_scores'))
+    return counts
+
+
+def log_markets(odds: Dict[str, Any]):
+    """Log every market of an odds dict, flagging partial and missing ones"""
+    for label, outcomes, keys in MARKETS:
+        values = [odds.get(key) for key in keys]
+        if all(values):
+            logger.info("✅ {}: {}", label, format_market(outcomes, values))
+        elif any(values):
+            logger.warning("⚠️  {}: {} (partial)", label, format_market(outcomes, values))
+        else:
+            logger.info("ℹ️  {} odds missing", label)
+
+
+def log_sample_markets(odds: Dict[str, Any]):
+    """Log the markets of a sample record that have at least one odds value"""
+    for label, outcomes, keys in MARKETS:
+        values = [odds.get(key) for key in keys]
+        if any(values):
+            logger.info("{}: {}", label, format_market(outcomes, values))
+
+
+def summarize_results(results: List[Dict[str, Any]], extra_labels: Tuple[str, ...] = ()):
+    """Log per-market success rates (plus extra_labels, e.g. 'Correct Score') and a sample entry"""
+    total = len(results)
+    if not total:
+        return
+    
+    counts = count_markets(results)
+    
+    logger.info("\n📋 Scraped {} event entries", total)
+    
+    logger.info("\n📊 Odds Extraction Success Rates:")
+    for label in [label for label, _, _ in MARKETS] + list(extra_labels):
+        logger.info("   {} odds: {}/{} ({:.1f}%)", label, counts[label], total, counts[label] / total * 100)
+    
+    sample = results[0]
+    sample_odds = sample.get('odds', {})
+    logger.info("\n📝 Sample entry:")
+    logger.info("Event: {} vs {}", sample['home_team'], sample['away_team'])
+    log_sample_markets(sample_odds)
+    
+    exact_scores = sample_odds.get('exact_scores', {})
+    if 'Correct Score' in extra_labels and exact_scores:
+        logger.info("Correct Scores: {} scores available", len(exact_scores))
+        logger.info("Sample: {}", ", ".join(f"{score}: {odds}" for score, odds in islice(exact_scores.items(), 3)))
@@ -28,10 +28,10 @@ def run_command(cmd, description=""):
 
 
 def check_python_version():
-    """Ensure Python 3.8+ is being used"""
+    """Ensure Python 3.11+ is being used"""
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 8):
-        print("❌ Python 3.8+ is required")
+    if version.major < 3 or (version.major == 3 and version.minor < 11):
+        print("❌ Python 3.11+ is required")
         print(f"Current version: {version.major}.{version.minor}.{version.micro}")
         return False
     
@@ -1,16 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager, AsyncExitStack
+from collections import defaultdict
+from urllib.parse import urlparse
 from datetime import datetime
 import asyncio
 import time
 import random
-from playwright.async_api import async_playwright, Browser, Page
+import aiohttp
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 from loguru import logger
 import os
 
+try:
+    from curl_cffi.requests import AsyncSession as CurlAsyncSession
+except ImportError:  # curl_cffi is optional, aiohttp is used instead (without a browser TLS fingerprint)
+    CurlAsyncSession = None
 
-@dataclass
+
+@dataclass(slots=True)
 class ScrapedOdds:
     """Standardized odds data structure"""
     home_team: str
@@ -22,9 +31,17 @@ class ScrapedOdds:
     league: Optional[str] = None
     match_url: Optional[str] = None
     bookmaker_event_id: Optional[str] = None
+    # Extended markets (filled in by scrapers that read event detail pages)
+    btts_yes: Optional[float] = None
+    btts_no: Optional[float] = None
+    over_25: Optional[float] = None
+    under_25: Optional[float] = None
+    over_35: Optional[float] = None
+    under_35: Optional[float] = None
+    exact_scores: Dict[str, float] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedEvent:
     """Standardized event data structure"""
     home_team: str
@@ -34,6 +51,9 @@ class ScrapedEvent:
     event_url: str
     bookmaker_event_id: Optional[str] = None
     status: str = "scheduled"
+    # Odds picked up from the league page while scraping events
+    odds_data: Dict[str, Any] = field(default_factory=dict)
+    enhanced_odds_data: Dict[str, Any] = field(default_factory=dict)
 
 
 class BaseBookmakerScraper(ABC):
@@ -45,6 +65,33 @@ class BaseBookmakerScraper(ABC):
         self.delay_min, self.delay_max = delay_range
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self._playwright = None
+        
+        # Playwright driver shared with other scrapers; when unset each browser
+        # start launches (and its close stops) a driver of its own
+        self.playwright = None
+        
+        # Nested/repeated `async with scraper` blocks share one warm browser; it is
+        # closed when the outermost block that started it exits
+        self._browser_lock = asyncio.Lock()
+        self._browser_users = 0
+        self._owns_browser = False
+        
+        # Per-host pacing: navigations to one host start at least delay_range apart
+        # and at most host_concurrency of them are in flight at once
+        self.host_concurrency = 2
+        self._host_slots: Dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(self.host_concurrency))
+        self._host_next_request: Dict[str, float] = defaultdict(float)
+        
+        # Warm browser contexts lent out to concurrent tasks by pooled_page()
+        self.context_pool_size = 0
+        self._context_pool: Optional[asyncio.Queue] = None
+        
+        # Keep-alive HTTP session used by fetch_html() for pages that render without JS,
+        # with at most http_concurrency requests in flight; disabled while 0
+        self.http_concurrency = 0
+        self._http_session = None
+        self._http_slots: Optional[asyncio.Semaphore] = None
         
         # User agent rotation
         self.user_agents = [
@@ -55,17 +102,36 @@ class BaseBookmakerScraper(ABC):
     
     async def __aenter__(self):
         """Async context manager entry"""
-        await self.start_browser()
+        await self._ensure_browser()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        await self.close_browser()
+        await self._release_browser()
+    
+    async def _ensure_browser(self):
+        """Start the browser unless it is already running, and register one more user"""
+        async with self._browser_lock:
+            if self._browser_users == 0 and self.browser is None:
+                await self.start_browser()
+                self._owns_browser = True
+            self._browser_users += 1
+    
+    async def _release_browser(self):
+        """Unregister a user, closing the browser once the last one that started it is gone"""
+        async with self._browser_lock:
+            self._browser_users -= 1
+            if self._browser_users == 0 and self._owns_browser:
+                self._owns_browser = False
+                await self.close_browser()
     
     async def start_browser(self):
         """Initialize browser and page"""
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(
+        if self.playwright:
+            driver = self.playwright
+        else:
+            driver = self._playwright = await async_playwright().start()
+        self.browser = await driver.chromium.launch(
             headless=True,
             args=[
                 '--no-sandbox',
@@ -75,24 +141,79 @@ class BaseBookmakerScraper(ABC):
             ]
         )
         
+        self.page = await self.new_page()
+        
+        if self.context_pool_size:
+            self._context_pool = asyncio.Queue()
+            for _ in range(self.context_pool_size):
+                self._context_pool.put_nowait(await self.new_context())
+        
+        if self.http_concurrency:
+            self._http_slots = asyncio.Semaphore(self.http_concurrency)
+            if CurlAsyncSession:
+                # Impersonating Chrome also matches its TLS fingerprint, which bot protection checks
+                self._http_session = CurlAsyncSession(impersonate="chrome", timeout=15, max_clients=self.http_concurrency)
+            else:
+                self._http_session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit_per_host=self.http_concurrency, keepalive_timeout=30),
+                    headers={"User-Agent": random.choice(self.user_agents)},
+                    timeout=aiohttp.ClientTimeout(total=15)
+                )
+        
+        logger.info(f"Started browser for {self.bookmaker_name}")
+    
+    async def new_page(self) -> Page:
+        """Open a new page in its own browser context with the scraper defaults"""
         # Create new page with random user agent
         user_agent = random.choice(self.user_agents)
-        self.page = await self.browser.new_page(user_agent=user_agent)
+        page = await self.browser.new_page(user_agent=user_agent)
         
         # Set viewport to common desktop size
-        await self.page.set_viewport_size({"width": 1920, "height": 1080})
+        await page.set_viewport_size({"width": 1920, "height": 1080})
         
         # Block images and fonts to speed up loading (optional)
-        await self.page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2}", lambda route: route.abort())
+        await page.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2}", lambda route: route.abort())
         
-        logger.info(f"Started browser for {self.bookmaker_name}")
+        return page
+    
+    async def new_context(self) -> BrowserContext:
+        """Create a browser context with the scraper defaults"""
+        context = await self.browser.new_context(
+            user_agent=random.choice(self.user_agents),
+            viewport={"width": 1920, "height": 1080}
+        )
+        await context.route("**/*.{png,jpg,jpeg,gif,svg,woff,woff2}", lambda route: route.abort())
+        return context
+    
+    @asynccontextmanager
+    async def pooled_page(self):
+        """Borrow a warm context from the pool and open a page in it"""
+        context = await self._context_pool.get()
+        page = await context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+            self._context_pool.put_nowait(context)
     
     async def close_browser(self):
         """Close browser and cleanup"""
+        if self._http_session:
+            await self._http_session.close()
+            self._http_session = None
+        if self._context_pool:
+            while not self._context_pool.empty():
+                await self._context_pool.get_nowait().close()
+            self._context_pool = None
         if self.page:
             await self.page.close()
+            self.page = None
         if self.browser:
             await self.browser.close()
+            self.browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
         logger.info(f"Closed browser for {self.bookmaker_name}")
     
     async def random_delay(self):
@@ -101,22 +222,65 @@ class BaseBookmakerScraper(ABC):
         logger.debug(f"Waiting {delay:.2f} seconds...")
         await asyncio.sleep(delay)
     
-    async def safe_navigate(self, url: str, wait_for_selector: Optional[str] = None) -> bool:
+    async def _wait_for_host(self, host: str):
+        """Reserve the next request start for host and sleep until it is due"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._host_next_request[host])
+        self._host_next_request[host] = start + random.uniform(self.delay_min, self.delay_max)
+        
+        if start > now:
+            logger.debug(f"Waiting {start - now:.2f} seconds for {host}...")
+            await asyncio.sleep(start - now)
+    
+    async def safe_navigate(self, url: str, wait_for_selector: Optional[str] = None,
+                            page: Optional[Page] = None, delay: bool = True) -> bool:
         """Safely navigate to URL with error handling"""
+        # Concurrent callers pass their own page; delay=False skips host pacing
+        page = page or self.page
+        host = urlparse(url).netloc
         try:
-            logger.info(f"Navigating to: {url}")
-            await self.page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            if wait_for_selector:
-                await self.page.wait_for_selector(wait_for_selector, timeout=10000)
+            async with self._host_slots[host]:
+                if delay:
+                    await self._wait_for_host(host)
+                
+                logger.info(f"Navigating to: {url}")
+                await page.goto(url, wait_until="networkidle", timeout=30000)
+                
+                if wait_for_selector:
+                    await page.wait_for_selector(wait_for_selector, timeout=10000)
             
-            await self.random_delay()
             return True
             
         except Exception as e:
             logger.error(f"Failed to navigate to {url}: {str(e)}")
             return False
     
+    async def fetch_html(self, url: str) -> Optional[str]:
+        """GET a page over the keep-alive session, paced like safe_navigate; None when unavailable"""
+        if not self._http_session:
+            return None
+        
+        host = urlparse(url).netloc
+        try:
+            async with self._http_slots, self._host_slots[host]:
+                await self._wait_for_host(host)
+                logger.info(f"Fetching: {url}")
+                if CurlAsyncSession:
+                    response = await self._http_session.get(url)
+                    status, text = response.status_code, response.text
+                else:
+                    async with self._http_session.get(url) as response:
+                        status, text = response.status, await response.text()
+            
+            if status != 200:
+                logger.debug(f"HTTP {status} for {url}")
+                return None
+            return text
+        except Exception as e:
+            logger.debug(f"HTTP fetch failed for {url}: {e}")
+            return None
+    
     @abstractmethod
     async def get_football_events(self, leagues: List[str] = None) -> List[ScrapedEvent]:
         """Get list of upcoming football events"""
@@ -166,56 +330,93 @@ class BaseBookmakerScraper(ABC):
 class ScraperManager:
     """Manages multiple bookmaker scrapers"""
     
-    def __init__(self):
+    def __init__(self, scrape_timeout: float = 60, playwright=None):
         self.scrapers: Dict[str, BaseBookmakerScraper] = {}
+        self.scrape_timeout = scrape_timeout
+        self.playwright = playwright
+        self._exit_stack: Optional[AsyncExitStack] = None
+    
+    async def __aenter__(self):
+        """Keep every registered scraper's browser warm until exit, all on one Playwright driver"""
+        self._exit_stack = AsyncExitStack()
+        try:
+            driver = self.playwright or await self._exit_stack.enter_async_context(async_playwright())
+            for scraper in self.scrapers.values():
+                if scraper.playwright is None:
+                    scraper.playwright = driver
+                    self._exit_stack.callback(setattr, scraper, 'playwright', None)
+                await self._exit_stack.enter_async_context(scraper)
+        except Exception:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the browsers opened on entry"""
+        if self._exit_stack:
+            await self._exit_stack.aclose()
+            self._exit_stack = None
     
     def register_scraper(self, scraper: BaseBookmakerScraper):
         """Register a new scraper"""
         self.scrapers[scraper.bookmaker_name] = scraper
         logger.info(f"Registered scraper for {scraper.bookmaker_name}")
     
-    async def scrape_all_events(self, leagues: List[str] = None) -> Dict[str, List[ScrapedEvent]]:
-        """Scrape events from all registered scrapers"""
-        results = {}
-        
-        for name, scraper in self.scrapers.items():
-            try:
-                logger.info(f"Scraping events from {name}...")
+    async def _scrape_one(self, name: str, scraper: BaseBookmakerScraper, leagues: List[str] = None) -> List[ScrapedEvent]:
+        """Scrape events from a single scraper, bounded by the scrape timeout"""
+        try:
+            logger.info(f"Scraping events from {name}...")
+            async with asyncio.timeout(self.scrape_timeout):
                 async with scraper:
                     events = await scraper.get_football_events(leagues)
-                    results[name] = events
-                    logger.info(f"Scraped {len(events)} events from {name}")
-                    
-            except Exception as e:
-                logger.error(f"Error scraping {name}: {str(e)}")
-                results[name] = []
+            logger.info(f"Scraped {len(events)} events from {name}")
+            return events
+            
+        except TimeoutError:
+            logger.error(f"Timed out scraping {name} after {self.scrape_timeout}s")
+        except Exception as e:
+            logger.error(f"Error scraping {name}: {str(e)}")
         
-        return results
+        return []
+    
+    async def scrape_all_events(self, leagues: List[str] = None) -> Dict[str, List[ScrapedEvent]]:
+        """Scrape events from all registered scrapers concurrently"""
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                name: tg.create_task(self._scrape_one(name, scraper, leagues))
+                for name, scraper in self.scrapers.items()
+            }
+        
+        return {name: task.result() for name, task in tasks.items()}
+    
+    async def _scrape_odds_one(self, name: str, scraper: BaseBookmakerScraper, event: ScrapedEvent) -> Optional[ScrapedOdds]:
+        """Scrape odds for an event from a single scraper"""
+        try:
+            logger.info(f"Scraping odds from {name} for {event.home_team} vs {event.away_team}")
+            
+            async with scraper:
+                odds = await scraper.get_event_odds(event)
+            
+            if odds:
+                logger.info(f"Got odds from {name}: {odds.home_odds}-{odds.draw_odds}-{odds.away_odds}")
+            else:
+                logger.warning(f"No odds found from {name}")
+            return odds
+            
+        except Exception as e:
+            logger.error(f"Error getting odds from {name}: {str(e)}")
+            return None
     
     async def scrape_odds_for_event(self, event: ScrapedEvent, bookmaker_names: List[str] = None) -> Dict[str, Optional[ScrapedOdds]]:
-        """Scrape odds for a specific event from selected bookmakers"""
-        results = {}
+        """Scrape odds for a specific event from selected bookmakers concurrently"""
         target_scrapers = bookmaker_names or list(self.scrapers.keys())
         
-        for name in target_scrapers:
-            if name not in self.scrapers:
-                continue
-                
-            try:
-                scraper = self.scrapers[name]
-                logger.info(f"Scraping odds from {name} for {event.home_team} vs {event.away_team}")
-                
-                async with scraper:
-                    odds = await scraper.get_event_odds(event)
-                    results[name] = odds
-                    
-                    if odds:
-                        logger.info(f"Got odds from {name}: {odds.home_odds}-{odds.draw_odds}-{odds.away_odds}")
-                    else:
-                        logger.warning(f"No odds found from {name}")
-                        
-            except Exception as e:
-                logger.error(f"Error getting odds from {name}: {str(e)}")
-                results[name] = None
-        
-        return results
+        async with asyncio.TaskGroup() as tg:
+            tasks = {
+                name: tg.create_task(self._scrape_odds_one(name, self.scrapers[name], event))
+                for name in target_scrapers
+                if name in self.scrapers
+            }
+        
+        return {name: task.result() for name, task in tasks.items()}
@@ -1,14 +1,25 @@
 import re
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 from scrapers.base_scraper import BaseBookmakerScraper, ScrapedEvent, ScrapedOdds
 from loguru import logger
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # selectolax is optional, BeautifulSoup is used instead
+    HTMLParser = None
+
+# Elements whose class mentions "odd" hold the odds values
+ODDS_SELECTOR = 'div[class*="odd" i], span[class*="odd" i], td[class*="odd" i]'
+
 
 class LottolandScraper(BaseBookmakerScraper):
     """Scraper for Lottoland Austria sports betting"""
     
+    # Common prefixes/suffixes dropped from team names
+    _AFFIXES_TO_REMOVE = frozenset({"FC", "FK", "SK", "SV", "1.", "TSV", "VfB", "VfL", "e.V.", "1919", "1909", "1896"})
+    
     def __init__(self):
         super().__init__(
             bookmaker_name="Lottoland", 
@@ -31,27 +42,32 @@ class LottolandScraper(BaseBookmakerScraper):
             "Borussia Dortmund": "BVB Dortmund",
             "BV Borussia Dortmund": "BVB Dortmund",
         }
+        
+        # Memo of already normalized names, seeded with the mapped names
+        self._norm_cache: Dict[str, str] = {
+            name: self._strip_affixes(target) for name, target in self.team_name_mappings.items()
+        }
+    
+    def _strip_affixes(self, team_name: str) -> str:
+        """Drop common prefixes/suffixes from a team name"""
+        return " ".join(word for word in team_name.split() if word not in self._AFFIXES_TO_REMOVE)
     
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team names for consistent matching"""
         if not team_name:
             return ""
         
-        # Clean up the name
-        cleaned = team_name.strip()
-        
-        # Apply specific mappings
-        if cleaned in self.team_name_mappings:
-            cleaned = self.team_name_mappings[cleaned]
+        hit = self._norm_cache.get(team_name)
+        if hit is not None:
+            return hit
         
-        # Remove common prefixes/suffixes
-        prefixes_to_remove = ["FC", "FK", "SK", "SV", "1.", "TSV", "VfB", "VfL"]
-        suffixes_to_remove = ["e.V.", "1919", "1909", "1896"]
-        
-        words = cleaned.split()
-        words = [word for word in words if word not in prefixes_to_remove + suffixes_to_remove]
+        # Clean up the name and apply specific mappings
+        cleaned = team_name.strip()
+        cleaned = self.team_name_mappings.get(cleaned, cleaned)
         
-        return " ".join(words).strip()
+        normalized = self._strip_affixes(cleaned)
+        self._norm_cache[team_name] = normalized
+        return normalized
     
     async def get_football_events(self, leagues: List[str] = None) -> List[ScrapedEvent]:
         """Scrape upcoming football events from Lottoland"""
@@ -174,14 +190,6 @@ class LottolandScraper(BaseBookmakerScraper):
             
             # Get page content
             content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Look for odds containers (generic approach)
-            odds_containers = soup.find_all(['div', 'span', 'td'], class_=lambda x: x and 'odd' in x.lower())
-            
-            if not odds_containers:
-                # Try alternative selectors
-                odds_containers = soup.find_all(string=re.compile(r'\\d+\\.\\d{2}'))
             
             home_odds = None
             draw_odds = None 
@@ -189,12 +197,7 @@ class LottolandScraper(BaseBookmakerScraper):
             
             # Extract odds (this is very simplified and will need refinement)
             odds_values = []
-            for container in odds_containers[:10]:  # Check first 10 potential odds
-                if hasattr(container, 'get_text'):
-                    text = container.get_text().strip()
-                else:
-                    text = str(container).strip()
-                
+            for text in self._find_odds_texts(content):
                 odds_value = self.normalize_odds_value(text)
                 if odds_value and 1.01 <= odds_value <= 50.0:  # Reasonable odds range
                     odds_values.append(odds_value)
@@ -224,3 +227,29 @@ class LottolandScraper(BaseBookmakerScraper):
             logger.error(f"Error getting Lottoland odds: {e}")
         
         return None
+    
+    def _find_odds_texts(self, content: str, limit: int = 10) -> List[str]:
+        """Get the text of the first potential odds elements on the page"""
+        # Fast path: selectolax (Lexbor) parses and matches the selector in C
+        if HTMLParser is not None:
+            nodes = HTMLParser(content).css(ODDS_SELECTOR)
+            if nodes:
+                return [node.text(strip=True) for node in nodes[:limit]]
+        
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Look for odds containers (generic approach)
+        odds_containers = soup.find_all(['div', 'span', 'td'], class_=lambda x: x and 'odd' in x.lower())
+        
+        if not odds_containers:
+            # Try alternative selectors
+            odds_containers = soup.find_all(string=re.compile(r'\\d+\\.\\d{2}'))
+        
+        texts = []
+        for container in odds_containers[:limit]:
+            if hasattr(container, 'get_text'):
+                texts.append(container.get_text().strip())
+            else:
+                texts.append(str(container).strip())
+        
+        return texts
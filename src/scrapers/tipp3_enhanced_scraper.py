@@ -1,15 +1,90 @@
 import re
 import json
-from typing import List, Optional, Dict, Any
+import asyncio
+import time
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from itertools import islice
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from scrapers.base_scraper import BaseBookmakerScraper, ScrapedEvent, ScrapedOdds
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json encoder is used instead
+    orjson = None
+
+_ODDS_RE = re.compile(r'\b(\d{1,2}[,.]\d{1,2})\b')
+_THRESHOLD_RE = re.compile(r'(\d+[,.]\d+)')
+_EVENT_ID_RE = re.compile(r'^event_\d+$')
+
+# Only event containers (and their subtrees) are built from league pages
+_EVENT_STRAINER = SoupStrainer('div', id=_EVENT_ID_RE)
+
+# Columns of the scraped results buffer, in JSON export key order
+_RESULT_COLUMNS = ('event_id', 'home_team', 'away_team', 'league', 'match_date', 'event_url', 'odds')
+
+# Highest score _calculate_1x2_confidence can award, no later triple can beat it
+_MAX_1X2_CONFIDENCE = 9.0
+
+
+# Detail page sections keyed by a phrase of their German header
+_SECTION_MARKERS = {
+    'btts': 'Fällt für beide Teams mindestens je ein Tor?',
+    'ou': 'Wie viele Tore werden erzielt?',
+    'cs': 'Resultatwette',
+}
+
+# Runs in the browser: locates each market section by its header in one scan and
+# returns only the label/odds strings, so the full page HTML never leaves the browser
+_DETAIL_EXTRACT_JS = """
+(markers) => {
+    const text = (el) => el ? el.textContent.trim() : null;
+    const sections = {};
+
+    for (const header of document.querySelectorAll('.t3-match-details__entry-header')) {
+        const headerText = header.textContent;
+        for (const [key, marker] of Object.entries(markers)) {
+            if (!(key in sections) && headerText.includes(marker)) {
+                const entry = header.closest('.t3-match-details__entry');
+                const content = entry && entry.querySelector('.t3-match-details__entry-content');
+                if (content) sections[key] = content;
+                break;
+            }
+        }
+    }
+
+    const betElements = (root) => Array.from(root.querySelectorAll('.t3-bet-element'), (el) => ({
+        label: text(el.querySelector('.t3-bet-element__label')),
+        odds: text(el.querySelector('.t3-bet-element__field .t3-bet-button .t3-bet-button__text')),
+        spacer: el.classList.contains('spacer'),
+    }));
+
+    return {
+        btts: sections.btts ? betElements(sections.btts) : null,
+        ou: sections.ou ? Array.from(sections.ou.querySelectorAll('.t3-list-entry'), (entry) => ({
+            info: text(entry.querySelector('.t3-list-entry__info-muted')),
+            bets: Array.from(entry.querySelectorAll('.t3-list-entry__bet'),
+                             (bet) => text(bet.querySelector('.t3-bet-button .t3-bet-button__text'))),
+        })) : null,
+        cs: sections.cs ? Array.from(sections.cs.querySelectorAll('.t3-match-details__entry-row'), betElements) : null,
+    };
+}
+"""
+
 
 class Tipp3EnhancedScraper(BaseBookmakerScraper):
     """Enhanced tipp3 scraper that identifies specific bet types and saves results to JSON"""
     
+    # Goal thresholds we store, mapped to their (over, under) result keys
+    _OU_KEYS = {
+        1.5: ('over_15', 'under_15'),
+        2.5: ('over_25', 'under_25'),
+        3.5: ('over_35', 'under_35'),
+        4.5: ('over_45', 'under_45'),
+    }
+    
     def __init__(self):
         super().__init__(
             bookmaker_name="tipp3_enhanced", 
@@ -26,8 +101,16 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
             "La Liga": "https://www.tipp3.at/sport/fussball/spanien-wetten"
         }
         
-        # Store all results for JSON export
-        self.scraped_results = []
+        # Store all results for JSON export, one list per column
+        self.reset_results()
+        
+        # Event detail pages are loaded on pooled contexts; safe_navigate lets only
+        # host_concurrency of them navigate at once, so more contexts would sit idle
+        self.context_pool_size = self.host_concurrency
+        
+        # Detail odds already fetched this session: event_id -> (fetched_at, odds)
+        self.detail_cache_ttl = 300
+        self._detail_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team names for consistent matching"""
@@ -66,18 +149,25 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                 logger.error(f"Failed to navigate to {league_url}")
                 return events
             
-            await self.page.wait_for_timeout(5000)
+            # Continue as soon as the event list is rendered
+            try:
+                await self.page.wait_for_selector("div[id^='event_']", timeout=8000)
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timed out waiting for events on {league_name}")
+            
             content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, 'lxml', parse_only=_EVENT_STRAINER)
             
             # Find event containers
-            event_divs = soup.find_all('div', id=re.compile(r'^event_\d+$'))
+            event_divs = soup.find_all('div', id=_EVENT_ID_RE)
             logger.info(f"Found {len(event_divs)} event containers in {league_name}")
             
             if not event_divs:
                 logger.warning(f"No event containers found for {league_name}")
                 return events
             
+            # First pass: pull event ids, teams and URLs from the league page
+            parsed_events = []
             for event_div in event_divs:
                 try:
                     event_id = event_div['id'].replace('event_', '')
@@ -94,8 +184,8 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                     for team_link in team_links:
                         link_text = team_link.get_text().strip()
                         lines = link_text.split('\n')
-                        team_name_raw = lines[0].strip() if lines else link_text.strip()
-                        team_name = self.normalize_team_name(team_name_raw)
+                        # Already stripped, which is all normalize_team_name would do
+                        team_name = lines[0].strip() if lines else link_text
                         
                         if team_name:
                             teams.append(team_name)
@@ -109,43 +199,53 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                         logger.warning(f"Event {event_id} has {len(teams)} valid teams, expected 2: {teams}")
                         continue
                     
-                    home_team, away_team = teams[0], teams[1]
-                    
-                    # Enhanced odds analysis
-                    odds_data = await self._analyze_event_odds(event_div, event_id, home_team, away_team)
-                    
-                    # Create event
-                    event = ScrapedEvent(
-                        home_team=home_team,
-                        away_team=away_team,
-                        match_date=datetime.now() + timedelta(days=1),
-                        league=league_name,
-                        event_url=event_url or f"{self.base_url}/sportwetten/eventdetails?eventID={event_id}&caller=PRO",
-                        bookmaker_event_id=event_id,
-                        status="scheduled"
-                    )
-                    
-                    event.enhanced_odds_data = odds_data
-                    events.append(event)
-                    
-                    # Store result for JSON export
-                    result_entry = {
-                        "event_id": event_id,
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "league": league_name,
-                        "match_date": event.match_date.isoformat(),
-                        "event_url": event.event_url,
-                        "odds": odds_data
-                    }
-                    self.scraped_results.append(result_entry)
-                    
-                    logger.info(f"✅ {home_team} vs {away_team}: 1X2=[{odds_data.get('home_odds')}, {odds_data.get('draw_odds')}, {odds_data.get('away_odds')}]")
+                    parsed_events.append((event_div, event_id, teams[0], teams[1], event_url))
                 
                 except Exception as e:
                     logger.error(f"Error processing event div: {e}")
                     continue
             
+            # Enhanced odds analysis, detail pages are fetched concurrently
+            analyses = await asyncio.gather(
+                *[self._analyze_event_odds(event_div, event_id, home_team, away_team)
+                  for event_div, event_id, home_team, away_team, _ in parsed_events],
+                return_exceptions=True
+            )
+            
+            # Placeholder kick-off shared by every event on the page
+            default_match_date = datetime.now() + timedelta(days=1)
+            default_match_date_iso = default_match_date.isoformat()
+            
+            for (_, event_id, home_team, away_team, event_url), odds_data in zip(parsed_events, analyses):
+                if isinstance(odds_data, Exception):
+                    logger.error(f"Error analyzing odds for event {event_id}: {odds_data}")
+                    continue
+                
+                # Create event
+                event = ScrapedEvent(
+                    home_team=home_team,
+                    away_team=away_team,
+                    match_date=default_match_date,
+                    league=league_name,
+                    event_url=event_url or f"{self.base_url}/sportwetten/eventdetails?eventID={event_id}&caller=PRO",
+                    bookmaker_event_id=event_id,
+                    status="scheduled",
+                    enhanced_odds_data=odds_data
+                )
+                events.append(event)
+                
+                # Store result for JSON export
+                results = self.scraped_results
+                results['event_id'].append(event_id)
+                results['home_team'].append(home_team)
+                results['away_team'].append(away_team)
+                results['league'].append(league_name)
+                results['match_date'].append(default_match_date_iso)
+                results['event_url'].append(event.event_url)
+                results['odds'].append(odds_data)
+                
+                logger.info(f"✅ {home_team} vs {away_team}: 1X2=[{odds_data.get('home_odds')}, {odds_data.get('draw_odds')}, {odds_data.get('away_odds')}]")
+            
             logger.info(f"Successfully parsed {len(events)} events from {league_name}")
             
         except Exception as e:
@@ -161,8 +261,9 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         raw_odds_values = []
         
         for odds_span in odds_spans:
-            odds_text = odds_span.get_text().strip()
-            odds_match = re.search(r'\b(\d{1,2}[,.]\d{1,2})\b', odds_text)
+            # Odds spans hold a single text node, .string avoids the recursive get_text walk
+            odds_text = (odds_span.string or odds_span.get_text()).strip()
+            odds_match = _ODDS_RE.search(odds_text)
             if odds_match:
                 odds_value = self.normalize_odds_value(odds_match.group(1))
                 if odds_value and 1.01 <= odds_value <= 50.0:
@@ -214,6 +315,9 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                         'position': i,
                         'confidence': confidence_score
                     })
+                    
+                    if confidence_score >= _MAX_1X2_CONFIDENCE:
+                        break
         
         # Select best 1X2 candidate
         if potential_1x2_groups:
@@ -233,8 +337,16 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         
         # O/U and exact score odds will be extracted from event detail page later
         
-        # Extract detailed odds from event detail page
-        detailed_odds = await self._extract_detailed_odds_from_event_page(event_id)
+        # Extract detailed odds from event detail page, reusing a recent fetch of the same event
+        cached = self._detail_cache.get(event_id)
+        if cached and time.monotonic() - cached[0] < self.detail_cache_ttl:
+            logger.debug(f"Event {event_id}: Using cached detail odds")
+            detailed_odds = cached[1]
+        else:
+            detailed_odds = await self._extract_detailed_odds_from_event_page(event_id)
+            if detailed_odds:
+                self._detail_cache[event_id] = (time.monotonic(), detailed_odds)
+        
         if detailed_odds:
             odds_data.update(detailed_odds)
         
@@ -247,28 +359,22 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         try:
             # Navigate to event detail page
             event_url = f"{self.base_url}/sportwetten/eventdetails?eventID={event_id}&caller=PRO"
-            logger.info(f"Navigating to event detail page for {event_id}...")
-            
-            if not await self.safe_navigate(event_url):
-                logger.warning(f"Could not navigate to event detail page: {event_url}")
+            sections = await self._fetch_detail_sections(event_id, event_url)
+            if sections is None:
                 return detailed_odds
             
-            await self.page.wait_for_timeout(3000)
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
             # Extract BTTS odds using the exact structure you provided
-            btts_odds = self._extract_btts_odds(soup, event_id)
+            btts_odds = self._extract_btts_odds(sections.get('btts'), event_id)
             if btts_odds:
                 detailed_odds.update(btts_odds)
             
             # Extract Over/Under odds using the exact structure provided
-            ou_odds = self._extract_ou_odds(soup, event_id)
+            ou_odds = self._extract_ou_odds(sections.get('ou'), event_id)
             if ou_odds:
                 detailed_odds.update(ou_odds)
             
             # Extract correct score odds using the exact structure provided
-            correct_score_odds = self._extract_correct_score_odds(soup, event_id)
+            correct_score_odds = self._extract_correct_score_odds(sections.get('cs'), event_id)
             if correct_score_odds:
                 detailed_odds.update(correct_score_odds)
             
@@ -277,69 +383,48 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         
         return detailed_odds
     
-    def _extract_btts_odds(self, soup: BeautifulSoup, event_id: str) -> Dict[str, Any]:
+    async def _fetch_detail_sections(self, event_id: str, event_url: str) -> Optional[Dict[str, Any]]:
+        """Load an event detail page on a pooled page and extract its market sections in the browser"""
+        async with self.pooled_page() as page:
+            logger.info(f"Navigating to event detail page for {event_id}...")
+            
+            if not await self.safe_navigate(event_url, page=page):
+                logger.warning(f"Could not navigate to event detail page: {event_url}")
+                return None
+            
+            # Continue as soon as the market headers are rendered
+            try:
+                await page.wait_for_selector(".t3-match-details__entry-header", timeout=8000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Event {event_id}: Timed out waiting for market headers")
+            
+            return await page.evaluate(_DETAIL_EXTRACT_JS, _SECTION_MARKERS)
+    
+    def _extract_btts_odds(self, bet_elements: Optional[List[Dict[str, Any]]], event_id: str) -> Dict[str, Any]:
         """Extract BTTS odds using the exact HTML structure provided"""
         btts_data = {}
         
         try:
-            # Find the BTTS section header with the specific German text
-            btts_header = None
-            headers = soup.find_all('div', class_='t3-match-details__entry-header')
-            
-            for header in headers:
-                header_text = header.get_text().strip()
-                if 'Fällt für beide Teams mindestens je ein Tor?' in header_text:
-                    btts_header = header
-                    break
-            
-            if not btts_header:
-                logger.debug(f"Event {event_id}: BTTS header not found")
-                return btts_data
-            
-            logger.debug(f"Event {event_id}: Found BTTS header: {btts_header.get_text().strip()}")
-            
-            # Find the parent container
-            btts_container = btts_header.find_parent('div', class_='t3-match-details__entry')
-            if not btts_container:
-                logger.debug(f"Event {event_id}: BTTS container not found")
-                return btts_data
-            
-            # Find the content div
-            content_div = btts_container.find('div', class_='t3-match-details__entry-content')
-            if not content_div:
-                logger.debug(f"Event {event_id}: BTTS content div not found")
+            if bet_elements is None:
+                logger.debug(f"Event {event_id}: BTTS section not found")
                 return btts_data
             
-            # Find all bet elements within the content
-            bet_elements = content_div.find_all('div', class_='t3-bet-element')
             logger.debug(f"Event {event_id}: Found {len(bet_elements)} BTTS bet elements")
             
             for bet_element in bet_elements:
                 # Get the label (Ja/Nein)
-                label_div = bet_element.find('div', class_='t3-bet-element__label')
-                if not label_div:
+                if not bet_element['label']:
                     continue
                 
-                label = label_div.get_text().strip().lower()
+                label = bet_element['label'].lower()
                 logger.debug(f"Event {event_id}: Processing label: '{label}'")
                 
                 # Get the odds from the button span
-                field_div = bet_element.find('div', class_='t3-bet-element__field')
-                if not field_div:
-                    logger.debug(f"Event {event_id}: No field div found")
-                    continue
-                
-                button = field_div.find('button', class_='t3-bet-button')
-                if not button:
-                    logger.debug(f"Event {event_id}: No bet button found")
-                    continue
-                
-                odds_span = button.find('span', class_='t3-bet-button__text')
-                if not odds_span:
+                odds_text = bet_element['odds']
+                if not odds_text:
                     logger.debug(f"Event {event_id}: No odds span found")
                     continue
                 
-                odds_text = odds_span.get_text().strip()
                 odds_value = self.normalize_odds_value(odds_text)
                 logger.debug(f"Event {event_id}: Odds text '{odds_text}' -> value {odds_value}")
                 
@@ -365,52 +450,25 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         
         return btts_data
     
-    def _extract_ou_odds(self, soup: BeautifulSoup, event_id: str) -> Dict[str, Any]:
+    def _extract_ou_odds(self, list_entries: Optional[List[Dict[str, Any]]], event_id: str) -> Dict[str, Any]:
         """Extract Over/Under odds using the exact HTML structure provided"""
         ou_data = {}
         
         try:
-            # Find the O/U section header with the specific German text
-            ou_header = None
-            headers = soup.find_all('div', class_='t3-match-details__entry-header')
-            
-            for header in headers:
-                header_text = header.get_text().strip()
-                if 'Wie viele Tore werden erzielt?' in header_text:
-                    ou_header = header
-                    break
-            
-            if not ou_header:
-                logger.debug(f"Event {event_id}: O/U header not found")
+            if list_entries is None:
+                logger.debug(f"Event {event_id}: O/U section not found")
                 return ou_data
             
-            logger.debug(f"Event {event_id}: Found O/U header: {ou_header.get_text().strip()}")
-            
-            # Find the parent container
-            ou_container = ou_header.find_parent('div', class_='t3-match-details__entry')
-            if not ou_container:
-                logger.debug(f"Event {event_id}: O/U container not found")
-                return ou_data
-            
-            # Find the content div
-            content_div = ou_container.find('div', class_='t3-match-details__entry-content')
-            if not content_div:
-                logger.debug(f"Event {event_id}: O/U content div not found")
-                return ou_data
-            
-            # Find all list entries within the content
-            list_entries = content_div.find_all('div', class_='t3-list-entry')
             logger.debug(f"Event {event_id}: Found {len(list_entries)} O/U list entries")
             
             for entry in list_entries:
                 # Get the goal threshold from t3-list-entry__info-muted
-                info_div = entry.find('div', class_='t3-list-entry__info-muted')
-                if not info_div:
+                if not entry['info']:
                     continue
                 
                 # Extract the goal threshold (e.g., "2,5")
-                info_text = info_div.get_text().strip().replace('\n', ' ')
-                threshold_match = re.search(r'(\d+[,.]\d+)', info_text)
+                info_text = entry['info'].replace('\n', ' ')
+                threshold_match = _THRESHOLD_RE.search(info_text)
                 
                 if not threshold_match:
                     continue
@@ -424,54 +482,34 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                 logger.debug(f"Event {event_id}: Processing O/U {threshold} goals")
                 
                 # Find the two betting buttons (Over and Under)
-                bet_divs = entry.find_all('div', class_='t3-list-entry__bet')
+                bets = entry['bets']
                 
-                if len(bet_divs) != 2:
-                    logger.debug(f"Event {event_id}: Expected 2 bet divs for O/U {threshold}, found {len(bet_divs)}")
+                if len(bets) != 2:
+                    logger.debug(f"Event {event_id}: Expected 2 bet divs for O/U {threshold}, found {len(bets)}")
                     continue
                 
                 # First bet div is "mehr" (over), second is "weniger" (under)
-                over_div = bet_divs[0]
-                under_div = bet_divs[1]
+                over_text, under_text = bets
                 
                 # Extract Over odds
-                over_button = over_div.find('button', class_='t3-bet-button')
                 over_odds = None
-                if over_button:
-                    over_span = over_button.find('span', class_='t3-bet-button__text')
-                    if over_span:
-                        over_text = over_span.get_text().strip()
-                        over_odds = self.normalize_odds_value(over_text)
-                        logger.debug(f"Event {event_id}: Over {threshold} odds: {over_text} -> {over_odds}")
+                if over_text:
+                    over_odds = self.normalize_odds_value(over_text)
+                    logger.debug(f"Event {event_id}: Over {threshold} odds: {over_text} -> {over_odds}")
                 
                 # Extract Under odds
-                under_button = under_div.find('button', class_='t3-bet-button')
                 under_odds = None
-                if under_button:
-                    under_span = under_button.find('span', class_='t3-bet-button__text')
-                    if under_span:
-                        under_text = under_span.get_text().strip()
-                        under_odds = self.normalize_odds_value(under_text)
-                        logger.debug(f"Event {event_id}: Under {threshold} odds: {under_text} -> {under_odds}")
+                if under_text:
+                    under_odds = self.normalize_odds_value(under_text)
+                    logger.debug(f"Event {event_id}: Under {threshold} odds: {under_text} -> {under_odds}")
                 
                 # Store the odds based on threshold
                 if over_odds and under_odds:
-                    if threshold == 2.5:
-                        ou_data['over_25'] = over_odds
-                        ou_data['under_25'] = under_odds
-                        logger.info(f"Event {event_id}: Found O/U 2.5: Over {over_odds}, Under {under_odds}")
-                    elif threshold == 3.5:
-                        ou_data['over_35'] = over_odds
-                        ou_data['under_35'] = under_odds
-                        logger.info(f"Event {event_id}: Found O/U 3.5: Over {over_odds}, Under {under_odds}")
-                    elif threshold == 1.5:
-                        ou_data['over_15'] = over_odds
-                        ou_data['under_15'] = under_odds
-                        logger.info(f"Event {event_id}: Found O/U 1.5: Over {over_odds}, Under {under_odds}")
-                    elif threshold == 4.5:
-                        ou_data['over_45'] = over_odds
-                        ou_data['under_45'] = under_odds
-                        logger.info(f"Event {event_id}: Found O/U 4.5: Over {over_odds}, Under {under_odds}")
+                    keys = self._OU_KEYS.get(threshold)
+                    if keys:
+                        ou_data[keys[0]] = over_odds
+                        ou_data[keys[1]] = under_odds
+                        logger.info(f"Event {event_id}: Found O/U {threshold}: Over {over_odds}, Under {under_odds}")
                     else:
                         logger.debug(f"Event {event_id}: O/U {threshold} not stored (not a target threshold)")
                 else:
@@ -488,80 +526,36 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         
         return ou_data
     
-    def _extract_correct_score_odds(self, soup: BeautifulSoup, event_id: str) -> Dict[str, Any]:
+    def _extract_correct_score_odds(self, entry_rows: Optional[List[List[Dict[str, Any]]]], event_id: str) -> Dict[str, Any]:
         """Extract correct score odds using the exact HTML structure provided"""
         correct_score_data = {}
         
         try:
-            # Find the correct score section header with "Resultatwette"
-            correct_score_header = None
-            headers = soup.find_all('div', class_='t3-match-details__entry-header')
-            
-            for header in headers:
-                header_text = header.get_text().strip()
-                if 'Resultatwette' in header_text:
-                    correct_score_header = header
-                    break
-            
-            if not correct_score_header:
-                logger.debug(f"Event {event_id}: Correct score header not found")
-                return correct_score_data
-            
-            logger.debug(f"Event {event_id}: Found correct score header: {correct_score_header.get_text().strip()}")
-            
-            # Find the parent container
-            correct_score_container = correct_score_header.find_parent('div', class_='t3-match-details__entry')
-            if not correct_score_container:
-                logger.debug(f"Event {event_id}: Correct score container not found")
+            if entry_rows is None:
+                logger.debug(f"Event {event_id}: Correct score section not found")
                 return correct_score_data
             
-            # Find the content div
-            content_div = correct_score_container.find('div', class_='t3-match-details__entry-content')
-            if not content_div:
-                logger.debug(f"Event {event_id}: Correct score content div not found")
-                return correct_score_data
-            
-            # Find all entry rows
-            entry_rows = content_div.find_all('div', class_='t3-match-details__entry-row')
             logger.debug(f"Event {event_id}: Found {len(entry_rows)} correct score entry rows")
             
             exact_scores = {}
             
-            for row in entry_rows:
-                # Find all bet elements in this row
-                bet_elements = row.find_all('div', class_='t3-bet-element')
-                
+            for bet_elements in entry_rows:
                 for bet_element in bet_elements:
                     # Get the score label (e.g., "1:0", "2:2", etc.)
-                    label_div = bet_element.find('div', class_='t3-bet-element__label')
-                    if not label_div:
-                        continue
-                    
-                    score_label = label_div.get_text().strip()
+                    score_label = bet_element['label']
                     
                     # Skip empty elements and spacers
-                    if not score_label or 'spacer' in bet_element.get('class', []):
+                    if not score_label or bet_element['spacer']:
                         continue
                     
                     logger.debug(f"Event {event_id}: Processing correct score: '{score_label}'")
                     
                     # Get the odds from the button span
-                    field_div = bet_element.find('div', class_='t3-bet-element__field')
-                    if not field_div:
-                        logger.debug(f"Event {event_id}: No field div found for score {score_label}")
-                        continue
-                    
-                    button = field_div.find('button', class_='t3-bet-button')
-                    if not button:
-                        logger.debug(f"Event {event_id}: No bet button found for score {score_label}")
-                        continue
-                    
-                    odds_span = button.find('span', class_='t3-bet-button__text')
-                    if not odds_span:
+                    odds_text = bet_element['odds']
+                    if not odds_text:
                         logger.debug(f"Event {event_id}: No odds span found for score {score_label}")
                         continue
                     
-                    odds_text = odds_span.get_text().strip()
                     odds_value = self.normalize_odds_value(odds_text)
                     
                     if odds_value:
@@ -576,8 +570,7 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                 logger.info(f"Event {event_id}: Successfully extracted {score_count} correct score odds")
                 
                 # Show a sample of extracted scores for debugging
-                sample_scores = list(exact_scores.items())[:3]
-                sample_text = ", ".join([f"{score}: {odds}" for score, odds in sample_scores])
+                sample_text = ", ".join(f"{score}: {odds}" for score, odds in islice(exact_scores.items(), 3))
                 logger.debug(f"Event {event_id}: Sample correct scores: {sample_text}")
             else:
                 logger.warning(f"Event {event_id}: No correct score odds found")
@@ -617,7 +610,7 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
     async def get_event_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
         """Get odds for a specific event (uses pre-analyzed enhanced odds)"""
         try:
-            if hasattr(event, 'enhanced_odds_data') and event.enhanced_odds_data:
+            if event.enhanced_odds_data:
                 odds_data = event.enhanced_odds_data
                 
                 if all(odds_data.get(key) is not None for key in ['home_odds', 'draw_odds', 'away_odds']):
@@ -629,18 +622,17 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
                         draw_odds=odds_data['draw_odds'],
                         away_odds=odds_data['away_odds'],
                         league=event.league,
-                        match_url=event.event_url
+                        match_url=event.event_url,
+                        # Extended odds
+                        btts_yes=odds_data.get('btts_yes'),
+                        btts_no=odds_data.get('btts_no'),
+                        over_25=odds_data.get('over_25'),
+                        under_25=odds_data.get('under_25'),
+                        over_35=odds_data.get('over_35'),
+                        under_35=odds_data.get('under_35'),
+                        exact_scores=odds_data.get('exact_scores', {})
                     )
                     
-                    # Add extended odds
-                    scraped_odds.btts_yes = odds_data.get('btts_yes')
-                    scraped_odds.btts_no = odds_data.get('btts_no')
-                    scraped_odds.over_25 = odds_data.get('over_25')
-                    scraped_odds.under_25 = odds_data.get('under_25')
-                    scraped_odds.over_35 = odds_data.get('over_35')
-                    scraped_odds.under_35 = odds_data.get('under_35')
-                    scraped_odds.exact_scores = odds_data.get('exact_scores', {})
-                    
                     return scraped_odds
                 else:
                     logger.warning(f"Incomplete 1X2 odds for {event.home_team} vs {event.away_team}")
@@ -650,6 +642,16 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
         
         return None
     
+    def reset_results(self):
+        """Clear the scraped results buffer"""
+        self.scraped_results = {column: [] for column in _RESULT_COLUMNS}
+        # Number of results already appended to each NDJSON file
+        self._ndjson_written: Dict[str, int] = {}
+    
+    def results_as_records(self) -> List[Dict[str, Any]]:
+        """Build one dict per scraped event from the columnar results buffer"""
+        return [dict(zip(_RESULT_COLUMNS, row)) for row in zip(*self.scraped_results.values())]
+    
     def save_results_to_json(self, filename: str = None) -> str:
         """Save all scraped results to JSON file"""
         if not filename:
@@ -657,12 +659,41 @@ class Tipp3EnhancedScraper(BaseBookmakerScraper):
             filename = f"tipp3_enhanced_results_{timestamp}.json"
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(self.scraped_results, f, indent=2, ensure_ascii=False)
+            records = self.results_as_records()
+            if orjson:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(records, f, indent=2, ensure_ascii=False)
             
-            logger.info(f"✅ Saved {len(self.scraped_results)} results to {filename}")
+            logger.info(f"✅ Saved {len(self.scraped_results['event_id'])} results to {filename}")
             return filename
         
         except Exception as e:
             logger.error(f"Error saving results to JSON: {e}")
             return None
+    
+    def save_results_to_ndjson(self, filename: str = None) -> str:
+        """Append the results not yet written to an NDJSON file, one event per line"""
+        if not filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"tipp3_enhanced_results_{timestamp}.ndjson"
+        
+        try:
+            written = self._ndjson_written.get(filename, 0)
+            rows = islice(zip(*self.scraped_results.values()), written, None)
+            records = [dict(zip(_RESULT_COLUMNS, row)) for row in rows]
+            with open(filename, 'ab') as f:
+                if orjson:
+                    f.writelines(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b"\n" for record in records)
+                else:
+                    f.writelines((json.dumps(record, ensure_ascii=False) + "\n").encode('utf-8') for record in records)
+            
+            self._ndjson_written[filename] = written + len(records)
+            logger.info(f"✅ Appended {len(records)} results to {filename}")
+            return filename
+        
+        except Exception as e:
+            logger.error(f"Error saving results to NDJSON: {e}")
+            return None
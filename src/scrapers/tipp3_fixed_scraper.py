@@ -1,10 +1,48 @@
 import re
-from typing import List, Optional, Dict, Any
+import asyncio
+import time
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from scrapers.base_scraper import BaseBookmakerScraper, ScrapedEvent, ScrapedOdds
 from loguru import logger
 
+_ODDS_RE = re.compile(r'\b(\d{1,2}[,.]\d{1,2})\b')
+_BUTTON_ODDS_RE = re.compile(r'\b(\d{1,2}\.\d{2})\b')
+_DECIMAL_ODDS_RE = re.compile(r'(\d{1,2}\.\d{2})')
+# BTTS and Over/Under market labels, told apart by the named group that matched
+_MARKET_RE = re.compile(
+    r'(?P<btts>scoren beide|both.*score|btts)'
+    r'|(?P<ou>toranzahl|über.*2\.?5|unter.*2\.?5|over.*2\.?5|under.*2\.?5)',
+    re.IGNORECASE
+)
+_SCORE_RE = re.compile(r'(\d+):(\d+)')
+# Markets available from the league page without opening the event details page
+_1X2_ONLY = frozenset({'1x2'})
+# Betting buttons: any <button> whose class mentions "bet", case-insensitively
+_BET_BUTTONS_XPATH = etree.XPath("//button[contains(translate(@class, 'BET', 'bet'), 'bet')]")
+# Shared detail page parser; comments and processing instructions are never looked at
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8', remove_comments=True, remove_pis=True)
+
+
+def _decimal_odds(odds_str: str) -> float:
+    """Convert a regex-matched decimal odds string ("1,85" / "1.85") to float"""
+    return float(odds_str.replace(',', '.'))
+
+
+# Runs in the browser: returns id, team links and odds texts of every event container
+_LEAGUE_EXTRACT_JS = """
+() => Array.from(document.querySelectorAll('div[id^="event_"]'))
+    .filter((div) => /^event_\\d+$/.test(div.id))
+    .map((div) => ({
+        id: div.id,
+        teams: Array.from(div.querySelectorAll('a.t3-list-entry__player'),
+                          (a) => ({text: a.textContent, href: a.getAttribute('href')})),
+        odds: Array.from(div.querySelectorAll('span.t3-bet-button__text'), (span) => span.textContent),
+    }))
+"""
+
 
 class Tipp3FixedScraper(BaseBookmakerScraper):
     """Fixed tipp3 scraper using correct selectors identified from structure analysis"""
@@ -47,6 +85,19 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
             "RB Leipzig": "RB Leipzig",
             "Leverkusen": "Bayer Leverkusen",
         }
+        # Case-insensitive view of the mappings, so "BAYERN" and "bayern" map too
+        self._team_map_ci = {name.casefold(): mapped for name, mapped in self.team_name_mappings.items()}
+        
+        # Leagues are scraped in parallel, each on a page from a warm context
+        self.max_concurrency = 3
+        self.context_pool_size = self.max_concurrency
+        
+        # How long to wait for odds content to render, in milliseconds
+        self.default_timeout = 15000
+        
+        # Odds read from event detail pages: bookmaker_event_id -> (fetched_at, odds)
+        self.odds_cache_ttl = 300
+        self._odds_cache: Dict[str, Tuple[float, ScrapedOdds]] = {}
     
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team names for consistent matching"""
@@ -55,13 +106,9 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
         
         cleaned = team_name.strip()
         
-        # Apply specific mappings
-        if cleaned in self.team_name_mappings:
-            return self.team_name_mappings[cleaned]
-        
-        # Don't normalize by removing prefixes/suffixes for Austrian sites
-        # Keep original team names as they appear
-        return cleaned
+        # Apply specific mappings, otherwise keep the original team name as it appears
+        # (don't normalize by removing prefixes/suffixes for Austrian sites)
+        return self._team_map_ci.get(cleaned.casefold(), cleaned)
     
     async def get_football_events(self, leagues: List[str] = None) -> List[ScrapedEvent]:
         """Scrape events from specific tipp3 league URLs using correct selectors"""
@@ -69,39 +116,50 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
         
         target_leagues = leagues if leagues else list(self.league_urls.keys())
         
+        known_leagues = []
         for league_name in target_leagues:
             if league_name not in self.league_urls:
                 logger.warning(f"Unknown league: {league_name}")
                 continue
-                
-            logger.info(f"Scraping {league_name}...")
-            events = await self._scrape_league_events(league_name, self.league_urls[league_name])
+            known_leagues.append(league_name)
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def scrape_bounded(league_name: str) -> List[ScrapedEvent]:
+            async with semaphore:
+                logger.info(f"Scraping {league_name}...")
+                async with self.pooled_page() as page:
+                    return await self._scrape_league_events(league_name, self.league_urls[league_name], page)
+        
+        results = await asyncio.gather(*[scrape_bounded(league) for league in known_leagues], return_exceptions=True)
+        
+        for league_name, events in zip(known_leagues, results):
+            if isinstance(events, Exception):
+                logger.error(f"Error scraping {league_name}: {events}")
+                continue
             all_events.extend(events)
-            
-            # Small delay between leagues
-            await self.random_delay()
         
         logger.info(f"Total events scraped from tipp3: {len(all_events)}")
         return all_events
     
-    async def _scrape_league_events(self, league_name: str, league_url: str) -> List[ScrapedEvent]:
+    async def _scrape_league_events(self, league_name: str, league_url: str, page: Optional[Page] = None) -> List[ScrapedEvent]:
         """Scrape events from a specific league URL using correct HTML structure"""
         events = []
+        page = page or self.page
         
         try:
-            if not await self.safe_navigate(league_url):
+            if not await self.safe_navigate(league_url, page=page):
                 logger.error(f"Failed to navigate to {league_url}")
                 return events
             
-            # Wait for dynamic content to load
-            await self.page.wait_for_timeout(5000)
-            
-            # Get page content
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            # Wait for the event containers to render
+            try:
+                await page.wait_for_selector('div[id^="event_"]', state='attached', timeout=self.default_timeout)
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timed out waiting for events on {league_name}")
             
-            # Find event containers using the pattern id="event_123456"
-            event_divs = soup.find_all('div', id=re.compile(r'^event_\d+$'))
+            # Pull event containers straight out of the DOM
+            event_divs = await page.evaluate(_LEAGUE_EXTRACT_JS)
             logger.info(f"Found {len(event_divs)} event containers in {league_name}")
             
             if not event_divs:
@@ -114,8 +172,8 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                     event_id = event_div['id'].replace('event_', '')
                     logger.debug(f"Processing event container {event_id}")
                     
-                    # Find the two team name links within this event div
-                    team_links = event_div.find_all('a', class_='t3-list-entry__player')
+                    # The two team name links within this event div
+                    team_links = event_div['teams']
                     logger.debug(f"Found {len(team_links)} team links in event {event_id}")
                     
                     if len(team_links) != 2:
@@ -128,9 +186,7 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                     
                     for team_link in team_links:
                         # Get team name (first line before any league info)
-                        link_text = team_link.get_text().strip()
-                        lines = link_text.split('\n')
-                        team_name_raw = lines[0].strip() if lines else link_text.strip()
+                        team_name_raw = team_link['text'].strip().partition('\n')[0].strip()
                         team_name = self.normalize_team_name(team_name_raw)
                         
                         if team_name:
@@ -138,7 +194,7 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                         
                         # Get event URL (should be same for both team links)
                         if not event_url:
-                            href = team_link.get('href', '')
+                            href = team_link['href'] or ''
                             if href and 'eventdetails' in href:
                                 if href.startswith('/'):
                                     event_url = self.base_url + href
@@ -152,18 +208,22 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                     
                     home_team, away_team = teams[0], teams[1]
                     
-                    # Find odds within this event div - look for spans with t3-bet-button__text class
-                    odds_spans = event_div.find_all('span', class_='t3-bet-button__text')
-                    logger.debug(f"Found {len(odds_spans)} odds spans in event {event_id}")
+                    # Odds texts of the t3-bet-button__text spans within this event div
+                    odds_texts = event_div['odds']
+                    logger.debug(f"Found {len(odds_texts)} odds spans in event {event_id}")
                     
                     # Extract odds values
                     odds_values = []
-                    for odds_span in odds_spans:
-                        odds_text = odds_span.get_text().strip()
+                    for odds_text in odds_texts:
+                        odds_text = odds_text.strip()
+                        # Decimal odds need a separator, skip the regex for texts without one
+                        if '.' not in odds_text and ',' not in odds_text:
+                            continue
+                        
                         # Look for decimal odds pattern (handle both comma and dot separators)
-                        odds_match = re.search(r'\b(\d{1,2}[,.]\d{1,2})\b', odds_text)
+                        odds_match = _ODDS_RE.search(odds_text)
                         if odds_match:
-                            odds_value = self.normalize_odds_value(odds_match.group(1))
+                            odds_value = _decimal_odds(odds_match.group(1))
                             if odds_value and 1.01 <= odds_value <= 50.0:
                                 odds_values.append(odds_value)
                                 logger.debug(f"Found odds: {odds_value} from text: '{odds_text}'")
@@ -178,15 +238,14 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                         league=league_name,
                         event_url=event_url or f"{self.base_url}/sportwetten/eventdetails?eventID={event_id}&caller=PRO",
                         bookmaker_event_id=event_id,
-                        status="scheduled"
+                        status="scheduled",
+                        # Store odds data in event for later use
+                        odds_data={
+                            'raw_odds': odds_values,
+                            'odds_count': len(odds_values)
+                        }
                     )
                     
-                    # Store odds data in event for later use
-                    event.odds_data = {
-                        'raw_odds': odds_values,
-                        'odds_count': len(odds_values)
-                    }
-                    
                     events.append(event)
                     logger.info(f"✅ Created event: {home_team} vs {away_team} (ID: {event_id}, Odds: {len(odds_values)})")
                 
@@ -201,64 +260,119 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
         
         return events
     
-    async def get_event_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
-        """Get odds for a specific event (uses odds already scraped from league page)"""
-        try:
-            logger.info(f"Getting odds for {event.home_team} vs {event.away_team}")
+    def _odds_without_navigation(self, event: ScrapedEvent, want_markets: FrozenSet[str]) -> Tuple[bool, Optional[ScrapedOdds]]:
+        """Answer from league page odds or the detail cache; returns (answered, odds), odds being the 1X2 fallback when not answered"""
+        logger.info(f"Getting odds for {event.home_team} vs {event.away_team}")
+        prescraped_odds = None
+        
+        # Check if we already have odds data from the league page scraping
+        if event.odds_data:
+            raw_odds = event.odds_data.get('raw_odds', [])
+            logger.info(f"Using pre-scraped odds: {len(raw_odds)} values found")
             
-            # Check if we already have odds data from the league page scraping
-            if hasattr(event, 'odds_data') and event.odds_data:
-                raw_odds = event.odds_data.get('raw_odds', [])
-                logger.info(f"Using pre-scraped odds: {len(raw_odds)} values found")
+            if len(raw_odds) >= 3:
+                # Assume first 3 odds are 1X2 (Home, Draw, Away)
+                home_odds = raw_odds[0]
+                draw_odds = raw_odds[1] 
+                away_odds = raw_odds[2]
                 
-                if len(raw_odds) >= 3:
-                    # Assume first 3 odds are 1X2 (Home, Draw, Away)
-                    home_odds = raw_odds[0]
-                    draw_odds = raw_odds[1] 
-                    away_odds = raw_odds[2]
-                    
-                    scraped_odds = ScrapedOdds(
-                        home_team=event.home_team,
-                        away_team=event.away_team,
-                        match_date=event.match_date,
-                        home_odds=home_odds,
-                        draw_odds=draw_odds,
-                        away_odds=away_odds,
-                        league=event.league,
-                        match_url=event.event_url
-                    )
-                    
-                    logger.info(f"✅ Created odds: {home_odds}-{draw_odds}-{away_odds}")
-                    return scraped_odds
-                else:
-                    logger.warning(f"Not enough pre-scraped odds: {len(raw_odds)} found, need at least 3")
-            
-            # Fallback: Navigate to event details page for more detailed odds extraction
+                prescraped_odds = ScrapedOdds(
+                    home_team=event.home_team,
+                    away_team=event.away_team,
+                    match_date=event.match_date,
+                    home_odds=home_odds,
+                    draw_odds=draw_odds,
+                    away_odds=away_odds,
+                    league=event.league,
+                    match_url=event.event_url
+                )
+                
+                logger.info(f"✅ Created odds: {home_odds}-{draw_odds}-{away_odds}")
+                if want_markets <= _1X2_ONLY:
+                    return True, prescraped_odds
+            else:
+                logger.warning(f"Not enough pre-scraped odds: {len(raw_odds)} found, need at least 3")
+        
+        # Reuse a recent detail page extraction for the same event
+        cached = self._odds_cache.get(event.bookmaker_event_id)
+        if cached and time.monotonic() - cached[0] < self.odds_cache_ttl:
+            logger.info(f"Using cached detail odds for event {event.bookmaker_event_id}")
+            return True, cached[1]
+        
+        if not event.event_url or 'eventdetails' not in event.event_url:
+            logger.warning(f"No valid event URL for {event.home_team} vs {event.away_team}")
+            return True, prescraped_odds
+        
+        return False, prescraped_odds
+    
+    async def get_event_odds(self, event: ScrapedEvent, page: Optional[Page] = None,
+                             want_markets: FrozenSet[str] = _1X2_ONLY) -> Optional[ScrapedOdds]:
+        """Get odds for a specific event (league page odds cover 1X2; other want_markets need the details page)"""
+        try:
+            answered, odds = self._odds_without_navigation(event, want_markets)
+            if answered:
+                return odds
+            return await self._get_detail_page_odds(event, page or self.page, odds)
+        except Exception as e:
+            logger.error(f"Error getting tipp3 odds for {event.home_team} vs {event.away_team}: {e}")
+        return None
+    
+    async def _get_detail_page_odds(self, event: ScrapedEvent, page: Page,
+                                    prescraped_odds: Optional[ScrapedOdds]) -> Optional[ScrapedOdds]:
+        """Navigate to the event details page for odds, falling back to prescraped_odds"""
+        try:
             logger.info("Falling back to event details page for odds extraction")
             
-            if not event.event_url or 'eventdetails' not in event.event_url:
-                logger.warning(f"No valid event URL for {event.home_team} vs {event.away_team}")
-                return None
-            
-            if not await self.safe_navigate(event.event_url):
+            if not await self.safe_navigate(event.event_url, page=page):
                 logger.warning(f"Could not navigate to event URL: {event.event_url}")
-                return None
+                return prescraped_odds
             
-            # Wait for page to load
-            await self.page.wait_for_timeout(5000)
+            # Wait for the odds buttons to render
+            try:
+                await page.wait_for_selector('button.t3-bet-button', state='attached', timeout=self.default_timeout)
+            except PlaywrightTimeoutError:
+                logger.warning(f"Timed out waiting for odds on {event.event_url}")
             
-            return await self._extract_detailed_odds(event)
+            scraped_odds = await self._extract_detailed_odds(event, page)
+            if scraped_odds and event.bookmaker_event_id:
+                self._odds_cache[event.bookmaker_event_id] = (time.monotonic(), scraped_odds)
+            return scraped_odds or prescraped_odds
                 
         except Exception as e:
             logger.error(f"Error getting tipp3 odds for {event.home_team} vs {event.away_team}: {e}")
         
-        return None
+        return prescraped_odds
+    
+    async def get_event_odds_batch(self, events: List[ScrapedEvent],
+                                   want_markets: FrozenSet[str] = _1X2_ONLY) -> List[Optional[ScrapedOdds]]:
+        """Get odds for several events concurrently, borrowing a pooled page only for those that need navigation"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def get_bounded(event: ScrapedEvent) -> Optional[ScrapedOdds]:
+            answered, odds = self._odds_without_navigation(event, want_markets)
+            if answered:
+                return odds
+            async with semaphore:
+                async with self.pooled_page() as page:
+                    return await self._get_detail_page_odds(event, page, odds)
+        
+        results = await asyncio.gather(*[get_bounded(event) for event in events], return_exceptions=True)
+        
+        odds = []
+        for event, result in zip(events, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting tipp3 odds for {event.home_team} vs {event.away_team}: {result}")
+                result = None
+            odds.append(result)
+        
+        return odds
     
-    async def _extract_detailed_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
+    async def _extract_detailed_odds(self, event: ScrapedEvent, page: Optional[Page] = None) -> Optional[ScrapedOdds]:
         """Extract detailed odds from event details page"""
+        page = page or self.page
         try:
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            content = await page.content()
+            root = lxml_html.fromstring(content.encode('utf-8'), parser=_HTML_PARSER)
             
             odds_data = {
                 'home_odds': None,
@@ -274,19 +388,31 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
             }
             
             # Look for betting buttons - tipp3 uses buttons with odds
-            bet_buttons = soup.find_all('button', class_=lambda x: x and 'bet' in ' '.join(x).lower())
+            bet_buttons = _BET_BUTTONS_XPATH(root)
             
             logger.debug(f"Found {len(bet_buttons)} betting buttons")
             
+            # text_content() walks all descendants, so read each button's text only once
+            button_texts: Dict[Any, Tuple[str, str]] = {}
+            
+            def button_text_of(button) -> Tuple[str, str]:
+                cached = button_texts.get(button)
+                if cached is None:
+                    text = button.text_content().strip()
+                    cached = button_texts[button] = (text, text.lower())
+                return cached
+            
             # Extract odds from buttons
             odds_found = []
             for button in bet_buttons[:20]:  # Check first 20 buttons
-                button_text = button.get_text().strip()
+                button_text, _ = button_text_of(button)
+                if '.' not in button_text:
+                    continue
                 
                 # Look for decimal odds pattern (e.g., "1.85", "2.20")
-                odds_match = re.search(r'\b(\d{1,2}\.\d{2})\b', button_text)
+                odds_match = _BUTTON_ODDS_RE.search(button_text)
                 if odds_match:
-                    odds_value = self.normalize_odds_value(odds_match.group(1))
+                    odds_value = _decimal_odds(odds_match.group(1))
                     if odds_value and 1.01 <= odds_value <= 50.0:
                         odds_found.append(odds_value)
                         logger.debug(f"Found odds: {odds_value} in button: {button_text[:50]}")
@@ -298,79 +424,54 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                 odds_data['away_odds'] = odds_found[2]
                 logger.info(f"Extracted 1X2 odds: {odds_found[0]}-{odds_found[1]}-{odds_found[2]}")
             
-            # Look for BTTS (Both Teams to Score) - German: "Scoren beide"
-            btts_elements = soup.find_all(text=re.compile(r'scoren beide|both.*score|btts', re.IGNORECASE))
-            for btts_elem in btts_elements:
-                parent = btts_elem.parent
-                if parent:
-                    # Look for nearby buttons with odds
-                    nearby_buttons = parent.find_all_next(['button'], limit=5)
-                    for button in nearby_buttons:
-                        button_text = button.get_text().strip()
-                        odds_match = re.search(r'(\d{1,2}\.\d{2})', button_text)
-                        if odds_match:
-                            odds_value = self.normalize_odds_value(odds_match.group(1))
-                            if odds_value:
-                                if 'ja' in button_text.lower() or 'yes' in button_text.lower():
-                                    odds_data['btts_yes'] = odds_value
-                                elif 'nein' in button_text.lower() or 'no' in button_text.lower():
-                                    odds_data['btts_no'] = odds_value
-            
-            # Look for Over/Under 2.5 goals - German: "Toranzahl"
-            ou_elements = soup.find_all(text=re.compile(r'toranzahl|über.*2\.?5|unter.*2\.?5|over.*2\.?5|under.*2\.?5', re.IGNORECASE))
-            for ou_elem in ou_elements:
-                parent = ou_elem.parent
-                if parent:
-                    nearby_buttons = parent.find_all_next(['button'], limit=10)
-                    for button in nearby_buttons:
-                        button_text = button.get_text().strip()
-                        if '2.5' in button_text or '2,5' in button_text:
-                            odds_match = re.search(r'(\d{1,2}\.\d{2})', button_text)
-                            if odds_match:
-                                odds_value = self.normalize_odds_value(odds_match.group(1))
-                                if odds_value:
-                                    if 'über' in button_text.lower() or 'over' in button_text.lower():
-                                        odds_data['over_25'] = odds_value
-                                    elif 'unter' in button_text.lower() or 'under' in button_text.lower():
-                                        odds_data['under_25'] = odds_value
-            
-            # Look for Over/Under 3.5 goals
-            for ou_elem in ou_elements:
-                parent = ou_elem.parent
-                if parent:
-                    nearby_buttons = parent.find_all_next(['button'], limit=10)
-                    for button in nearby_buttons:
-                        button_text = button.get_text().strip()
-                        if '3.5' in button_text or '3,5' in button_text:
-                            odds_match = re.search(r'(\d{1,2}\.\d{2})', button_text)
-                            if odds_match:
-                                odds_value = self.normalize_odds_value(odds_match.group(1))
-                                if odds_value:
-                                    if 'über' in button_text.lower() or 'over' in button_text.lower():
-                                        odds_data['over_35'] = odds_value
-                                    elif 'unter' in button_text.lower() or 'under' in button_text.lower():
-                                        odds_data['under_35'] = odds_value
-            
-            # Look for exact scores - often in sections with score patterns
-            score_buttons = soup.find_all('button', text=re.compile(r'\d+:\d+'))
-            for button in score_buttons:
-                button_text = button.get_text().strip()
-                score_match = re.match(r'(\d+):(\d+)', button_text)
-                if score_match:
-                    score = f"{score_match.group(1)}:{score_match.group(2)}"
-                    
-                    # Look for odds in the button or nearby elements
-                    odds_match = re.search(r'(\d{1,2}\.\d{2})', button_text)
-                    if not odds_match:
-                        # Check data attributes
-                        odds_attr = button.get('data-odds')
-                        if odds_attr:
-                            odds_match = re.search(r'(\d{1,2}\.\d{2})', odds_attr)
-                    
-                    if odds_match:
-                        odds_value = self.normalize_odds_value(odds_match.group(1))
-                        if odds_value:
-                            odds_data['exact_scores'][score] = odds_value
+            # BTTS (German: "Scoren beide") and Over/Under (German: "Toranzahl") odds sit in the
+            # buttons following their market label. Walk the document once, opening a window
+            # over the next 5 (BTTS) or 10 (O/U) buttons whenever a label goes by. Exact score
+            # buttons are picked up in the same walk.
+            btts_window = 0
+            ou_window = 0
+            for event_name, node in etree.iterwalk(root, events=('start', 'end')):
+                # Text nodes: an element's text follows its start tag, its tail follows its end tag
+                text = node.text if event_name == 'start' else node.tail
+                if text:
+                    for market_match in _MARKET_RE.finditer(text):
+                        if market_match.lastgroup == 'btts':
+                            btts_window = 5
+                        else:
+                            ou_window = 10
+                
+                if event_name != 'start' or node.tag != 'button':
+                    continue
+                
+                # Score text may sit in a child span, so test the button's full text
+                score_text = button_text_of(node)[0]
+                if _SCORE_RE.search(score_text):
+                    self._add_exact_score(node, score_text, odds_data)
+                
+                if not (btts_window or ou_window):
+                    continue
+                
+                button_text, button_lower = button_text_of(node)
+                odds_match = _DECIMAL_ODDS_RE.search(button_text)
+                odds_value = _decimal_odds(odds_match.group(1)) if odds_match else None
+                
+                if btts_window:
+                    btts_window -= 1
+                    if odds_value:
+                        if 'ja' in button_lower or 'yes' in button_lower:
+                            odds_data['btts_yes'] = odds_value
+                        elif 'nein' in button_lower or 'no' in button_lower:
+                            odds_data['btts_no'] = odds_value
+                
+                if ou_window:
+                    ou_window -= 1
+                    if odds_value:
+                        for threshold, suffix in (('2', '25'), ('3', '35')):
+                            if f'{threshold}.5' in button_text or f'{threshold},5' in button_text:
+                                if 'über' in button_lower or 'over' in button_lower:
+                                    odds_data[f'over_{suffix}'] = odds_value
+                                elif 'unter' in button_lower or 'under' in button_lower:
+                                    odds_data[f'under_{suffix}'] = odds_value
             
             # Create ScrapedOdds object if we found some odds
             if any(v is not None for v in [odds_data['home_odds'], odds_data['draw_odds'], odds_data['away_odds']]):
@@ -382,18 +483,16 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
                     draw_odds=odds_data['draw_odds'],
                     away_odds=odds_data['away_odds'],
                     league=event.league,
-                    match_url=event.event_url
+                    match_url=event.event_url,
+                    btts_yes=odds_data['btts_yes'],
+                    btts_no=odds_data['btts_no'],
+                    over_25=odds_data['over_25'],
+                    under_25=odds_data['under_25'],
+                    over_35=odds_data['over_35'],
+                    under_35=odds_data['under_35'],
+                    exact_scores=odds_data['exact_scores']
                 )
                 
-                # Add additional odds data as custom attributes
-                scraped_odds.btts_yes = odds_data['btts_yes']
-                scraped_odds.btts_no = odds_data['btts_no'] 
-                scraped_odds.over_25 = odds_data['over_25']
-                scraped_odds.under_25 = odds_data['under_25']
-                scraped_odds.over_35 = odds_data['over_35']
-                scraped_odds.under_35 = odds_data['under_35']
-                scraped_odds.exact_scores = odds_data['exact_scores']
-                
                 logger.info(f"✅ Extracted odds for {event.home_team} vs {event.away_team}")
                 logger.info(f"1X2: {odds_data['home_odds']}-{odds_data['draw_odds']}-{odds_data['away_odds']}")
                 
@@ -412,3 +511,24 @@ class Tipp3FixedScraper(BaseBookmakerScraper):
             logger.error(f"Error extracting detailed odds: {e}")
         
         return None
+    
+    def _add_exact_score(self, button, button_text: str, odds_data: Dict[str, Any]):
+        """Record the exact score odds carried by a score button"""
+        score_match = _SCORE_RE.match(button_text)
+        if not score_match:
+            return
+        
+        score = f"{score_match.group(1)}:{score_match.group(2)}"
+        
+        # Look for odds in the button or nearby elements
+        odds_match = _DECIMAL_ODDS_RE.search(button_text)
+        if not odds_match:
+            # Check data attributes
+            odds_attr = button.get('data-odds')
+            if odds_attr:
+                odds_match = _DECIMAL_ODDS_RE.search(odds_attr)
+        
+        if odds_match:
+            odds_value = _decimal_odds(odds_match.group(1))
+            if odds_value:
+                odds_data['exact_scores'][score] = odds_value
@@ -1,14 +1,182 @@
+import os
 import re
-from typing import List, Optional, Dict, Any
+import time
+import sqlite3
+import asyncio
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, ClassVar
 from datetime import datetime, timedelta
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from scrapers.base_scraper import BaseBookmakerScraper, ScrapedEvent, ScrapedOdds
 from loguru import logger
 
+# C-backed parser for BeautifulSoup; requires lxml
+_SOUP_PARSER = 'lxml'
+
+# Only content containers (and their subtrees) are built; <head>, top-level scripts and styles are skipped
+_CONTENT_STRAINER = SoupStrainer(['div', 'span', 'button', 'table', 'tr', 'td', 'li', 'a'])
+
+# Look for match containers - tipp3 specific selectors
+# Based on typical betting site structures, matches are often in:
+# - Tables with rows for each match
+# - Divs with specific classes for match cards
+# - Lists with match items
+_MATCH_SELECTOR = ', '.join([
+    # Table-based layouts
+    'tr[class*="match"]',
+    'tr[class*="event"]',
+    'tr[class*="game"]',
+    'tbody tr',
+    # Card-based layouts
+    'div[class*="match"]',
+    'div[class*="event"]',
+    'div[class*="game"]',
+    'div[class*="fixture"]',
+    # List-based layouts
+    'li[class*="match"]',
+    'li[class*="event"]',
+    # Generic containers that might hold match data
+    'div[data-event-id]',
+    'div[data-match-id]',
+    '[class*="odds-row"]',
+    '[class*="betting-row"]'
+])
+
+# First odds cell on league and event pages; its appearance means the content has rendered
+_ODDS_READY_SELECTOR = '[class*="odds"], [class*="quote"], button[class*="odd"]'
+
+# Look for 1X2 odds (Moneyline)
+_MONEYLINE_SELECTORS = [
+    '[class*="moneyline"]',
+    '[class*="1x2"]',
+    '[class*="three-way"]',
+    'button[class*="odd"]',
+    '.bet-button',
+    '[data-bet-type*="1x2"]'
+]
+
+# Common patterns for team vs team, each with the literal separators it needs (checked before searching)
+_VS_PATTERNS = [
+    (('-', '–'), re.compile(r'(.+?)\s*[-–]\s*(.+?)(?:\s|$)', re.IGNORECASE)),
+    (('vs',), re.compile(r'(.+?)\s*vs\s*(.+?)(?:\s|$)', re.IGNORECASE)),
+    (('gegen',), re.compile(r'(.+?)\s*gegen\s*(.+?)(?:\s|$)', re.IGNORECASE)),
+    ((':',), re.compile(r'(.+?)\s*:\s*(.+?)(?:\s|$)', re.IGNORECASE))
+]
+# Odds, dates and times that leak into team names
+_TEAM_NAME_NOISE_RE = re.compile(r'\d+\.\d+|\d{1,2}[./]\d{1,2}|\d{1,2}:\d{2}')
+_DATE_PATTERNS = [
+    re.compile(r'\b(\d{1,2})[./](\d{1,2})[./](\d{2,4})\b'),  # DD/MM/YYYY
+    re.compile(r'\b(\d{1,2})\.(\d{1,2})\.\b'),  # DD.MM.
+    re.compile(r'\b(\d{1,2}):(\d{2})\b')  # HH:MM (time)
+]
+_EVENT_ID_RE = re.compile(r'eventID=(\d+)')
+_ODDS_VALUE_RE = re.compile(r'\d+\.\d{2}')
+_DECIMAL_ODDS_RE = re.compile(r'(\d+\.\d{2})')
+_SCORE_RE = re.compile(r'(\d+):(\d+)')
+# Elements after a market label that may hold its odds
+_ODDS_CANDIDATE_STRAINER = SoupStrainer(['button', 'span', 'div'])
+# A score followed by its odds, e.g. "2:1 8.50" or "2:1 (8.50)"
+_SCORE_ODDS_RE = re.compile(r'(\d+:\d+)\s*[^\d]{0,8}(\d+\.\d{2})')
+# Text nodes after an exact score label that are scanned for score/odds pairs
+_SCORE_WINDOW_STRINGS = 60
+# Market labels on the event details page
+_BTTS_LABEL_RE = re.compile(r'beide.*tor|btts|both.*score', re.IGNORECASE)
+_OU_LABEL_RE = re.compile(r'über|under|over|2\.?5|3\.?5', re.IGNORECASE)
+_EXACT_SCORE_LABEL_RE = re.compile(r'resultat|exact.*score|endstand', re.IGNORECASE)
+_MARKET_LABEL_RE = re.compile(
+    '|'.join(label_re.pattern for label_re in (_BTTS_LABEL_RE, _OU_LABEL_RE, _EXACT_SCORE_LABEL_RE)),
+    re.IGNORECASE
+)
+
+
+# Team name normalizations
+_TEAM_NAME_MAPPINGS = {
+    # Austrian teams
+    "Austria Wien": "FK Austria Wien",
+    "Rapid Wien": "SK Rapid Wien", 
+    "Red Bull Salzburg": "FC Red Bull Salzburg",
+    "LASK": "LASK Linz",
+    "Sturm Graz": "SK Sturm Graz",
+    # German teams
+    "Bayern": "Bayern Munich",
+    "BVB": "Borussia Dortmund",
+    "RB Leipzig": "RB Leipzig",
+    "Leverkusen": "Bayer Leverkusen",
+    # English teams
+    "Man City": "Manchester City",
+    "Man United": "Manchester United",
+    "Tottenham": "Tottenham Hotspur",
+    # Add more as needed
+}
+
+# Common prefixes/suffixes removed for normalization
+_TEAM_PREFIXES = frozenset({"FC", "FK", "SK", "SV", "1.", "TSV", "VfB", "VfL", "SSC", "AC", "AS"})
+_TEAM_SUFFIXES = frozenset({"e.V.", "1919", "1909", "1896"})
+
+
+@lru_cache(maxsize=2048)
+def _normalize_team_name(cleaned: str) -> str:
+    """Normalize a stripped team name; teams recur across fixtures, so results are memoized"""
+    # Apply specific mappings
+    if cleaned in _TEAM_NAME_MAPPINGS:
+        return _TEAM_NAME_MAPPINGS[cleaned]
+    
+    # Remove common prefixes/suffixes for normalization
+    words = cleaned.split()
+    # Remove prefixes
+    if words and words[0] in _TEAM_PREFIXES:
+        words = words[1:]
+    # Remove suffixes  
+    if words and words[-1] in _TEAM_SUFFIXES:
+        words = words[:-1]
+    
+    return " ".join(words).strip()
+
+
+def _split_on_dash(text: str) -> Optional[Tuple[str, str]]:
+    """Split single-line "Home - Away ..." text into the groups the dash pattern would capture"""
+    dash = text.replace('–', '-').find('-', 1)
+    if dash == -1 or dash == len(text) - 1:
+        return None
+    away = text[dash + 1:].split(None, 1)
+    return text[:dash], away[0] if away else ''
+
+
+def _team_name_candidates(text: str):
+    """Yield possible (home, away) splits of an element's text, in _VS_PATTERNS order"""
+    patterns = _VS_PATTERNS
+    if '\n' not in text:
+        # The common "Home - Away" row needs no regex at all
+        dash_split = _split_on_dash(text)
+        if dash_split:
+            yield dash_split
+        patterns = _VS_PATTERNS[1:]
+    
+    text_lower = text.lower()
+    for separators, pattern in patterns:
+        if not any(separator in text_lower for separator in separators):
+            continue
+        match = pattern.search(text)
+        if match:
+            yield match.group(1), match.group(2)
+
 
 class Tipp3RealScraper(BaseBookmakerScraper):
     """Real tipp3 scraper targeting specific league URLs with actual odds extraction"""
     
+    # Specific league URLs discovered
+    league_urls: ClassVar[Dict[str, str]] = {
+        "Austrian Bundesliga": "https://www.tipp3.at/sport/fussball/oesterreich-wetten",
+        "Premier League": "https://www.tipp3.at/sport/fussball/england/premier-league-wetten",
+        "German Bundesliga": "https://www.tipp3.at/sport/fussball/deutschland/bundesliga-wetten",
+        "Serie A": "https://www.tipp3.at/sport/fussball/italien-wetten",
+        "Ligue 1": "https://www.tipp3.at/sport/fussball/frankreich-wetten",
+        "La Liga": "https://www.tipp3.at/sport/fussball/spanien-wetten"
+    }
+    
+    team_name_mappings: ClassVar[Dict[str, str]] = _TEAM_NAME_MAPPINGS
+    
     def __init__(self):
         super().__init__(
             bookmaker_name="tipp3", 
@@ -16,60 +184,64 @@ class Tipp3RealScraper(BaseBookmakerScraper):
             delay_range=(3, 6)  # Be respectful to tipp3
         )
         
-        # Specific league URLs discovered
-        self.league_urls = {
-            "Austrian Bundesliga": "https://www.tipp3.at/sport/fussball/oesterreich-wetten",
-            "Premier League": "https://www.tipp3.at/sport/fussball/england/premier-league-wetten",
-            "German Bundesliga": "https://www.tipp3.at/sport/fussball/deutschland/bundesliga-wetten",
-            "Serie A": "https://www.tipp3.at/sport/fussball/italien-wetten",
-            "Ligue 1": "https://www.tipp3.at/sport/fussball/frankreich-wetten",
-            "La Liga": "https://www.tipp3.at/sport/fussball/spanien-wetten"
-        }
+        # Leagues are scraped in parallel, each on a page from a warm context
+        self.max_concurrency = 3
+        self.context_pool_size = self.max_concurrency
+        
+        # How long to wait for odds content to render, in milliseconds
+        self.default_timeout = 5000
+        
+        # Event detail pages that render without JS are fetched over plain HTTP
+        self.http_concurrency = 5
+        
+        # Optional SQLite cache of fetched pages, keyed on URL, for development reruns;
+        # disabled unless a path is set
+        self.http_cache_path: Optional[str] = None
+        self.http_cache_ttl = 300
+        self._http_cache: Optional[sqlite3.Connection] = None
+    
+    async def start_browser(self):
+        """Start the browser and the HTTP session, plus the page cache if enabled"""
+        await super().start_browser()
+        if self.http_cache_path:
+            os.makedirs(os.path.dirname(self.http_cache_path) or '.', exist_ok=True)
+            self._http_cache = sqlite3.connect(self.http_cache_path)
+            self._http_cache.execute("CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, fetched_at REAL, html TEXT)")
+    
+    async def close_browser(self):
+        """Close the page cache, then the HTTP session and browser"""
+        if self._http_cache:
+            self._http_cache.close()
+            self._http_cache = None
+        await super().close_browser()
+    
+    async def fetch_html(self, url: str) -> Optional[str]:
+        """Serve a page from the cache when fresh, otherwise fetch it and cache the result"""
+        if self._http_cache:
+            row = self._http_cache.execute("SELECT fetched_at, html FROM pages WHERE url = ?", (url,)).fetchone()
+            if row and time.time() - row[0] < self.http_cache_ttl:
+                logger.debug(f"Cache hit: {url}")
+                return row[1]
         
-        # Team name normalizations
-        self.team_name_mappings = {
-            # Austrian teams
-            "Austria Wien": "FK Austria Wien",
-            "Rapid Wien": "SK Rapid Wien", 
-            "Red Bull Salzburg": "FC Red Bull Salzburg",
-            "LASK": "LASK Linz",
-            "Sturm Graz": "SK Sturm Graz",
-            # German teams
-            "Bayern": "Bayern Munich",
-            "BVB": "Borussia Dortmund",
-            "RB Leipzig": "RB Leipzig",
-            "Leverkusen": "Bayer Leverkusen",
-            # English teams
-            "Man City": "Manchester City",
-            "Man United": "Manchester United",
-            "Tottenham": "Tottenham Hotspur",
-            # Add more as needed
-        }
+        text = await super().fetch_html(url)
+        if text is not None and self._http_cache:
+            with self._http_cache:
+                self._http_cache.execute("REPLACE INTO pages VALUES (?, ?, ?)", (url, time.time(), text))
+        return text
+    
+    async def _wait_for_odds(self, page: Page):
+        """Wait until the first odds cell has rendered (or give up after default_timeout)"""
+        try:
+            await page.wait_for_selector(_ODDS_READY_SELECTOR, state='attached', timeout=self.default_timeout)
+        except PlaywrightTimeoutError:
+            logger.debug(f"No odds content rendered on {page.url} within {self.default_timeout}ms")
     
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team names for consistent matching"""
         if not team_name:
             return ""
         
-        cleaned = team_name.strip()
-        
-        # Apply specific mappings
-        if cleaned in self.team_name_mappings:
-            return self.team_name_mappings[cleaned]
-        
-        # Remove common prefixes/suffixes for normalization
-        prefixes_to_remove = ["FC", "FK", "SK", "SV", "1.", "TSV", "VfB", "VfL", "SSC", "AC", "AS"]
-        suffixes_to_remove = ["e.V.", "1919", "1909", "1896"]
-        
-        words = cleaned.split()
-        # Remove prefixes
-        if words and words[0] in prefixes_to_remove:
-            words = words[1:]
-        # Remove suffixes  
-        if words and words[-1] in suffixes_to_remove:
-            words = words[:-1]
-        
-        return " ".join(words).strip()
+        return _normalize_team_name(team_name.strip())
     
     async def get_football_events(self, leagues: List[str] = None) -> List[ScrapedEvent]:
         """Scrape events from specific tipp3 league URLs"""
@@ -77,84 +249,55 @@ class Tipp3RealScraper(BaseBookmakerScraper):
         
         target_leagues = leagues if leagues else list(self.league_urls.keys())
         
-        for league_name in target_leagues:
+        # Validate up front so only known leagues (each once) get a scrape task
+        for league_name in dict.fromkeys(target_leagues):
             if league_name not in self.league_urls:
                 logger.warning(f"Unknown league: {league_name}")
+        known_leagues = [league_name for league_name in dict.fromkeys(target_leagues) if league_name in self.league_urls]
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def scrape_bounded(league_name: str) -> List[ScrapedEvent]:
+            async with semaphore:
+                logger.info(f"Scraping {league_name}...")
+                async with self.pooled_page() as page:
+                    return await self._scrape_league_events(league_name, self.league_urls[league_name], page)
+        
+        results = await asyncio.gather(*[scrape_bounded(league) for league in known_leagues], return_exceptions=True)
+        
+        for league_name, events in zip(known_leagues, results):
+            if isinstance(events, Exception):
+                logger.error(f"Error scraping {league_name}: {events}")
                 continue
-                
-            logger.info(f"Scraping {league_name}...")
-            events = await self._scrape_league_events(league_name, self.league_urls[league_name])
             all_events.extend(events)
-            
-            # Small delay between leagues
-            await self.random_delay()
         
         logger.info(f"Total events scraped from tipp3: {len(all_events)}")
         return all_events
     
-    async def _scrape_league_events(self, league_name: str, league_url: str) -> List[ScrapedEvent]:
+    async def _scrape_league_events(self, league_name: str, league_url: str, page: Optional[Page] = None) -> List[ScrapedEvent]:
         """Scrape events from a specific league URL"""
         events = []
+        page = page or self.page
         
         try:
-            if not await self.safe_navigate(league_url):
+            if not await self.safe_navigate(league_url, page=page):
                 logger.error(f"Failed to navigate to {league_url}")
                 return events
             
             # Wait for dynamic content to load
-            await self.page.wait_for_timeout(3000)
+            await self._wait_for_odds(page)
             
             # Get page content
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Look for match containers - tipp3 specific selectors
-            # Based on typical betting site structures, matches are often in:
-            # - Tables with rows for each match
-            # - Divs with specific classes for match cards
-            # - Lists with match items
-            
-            potential_selectors = [
-                # Table-based layouts
-                'tr[class*="match"]',
-                'tr[class*="event"]', 
-                'tr[class*="game"]',
-                'tbody tr',
-                # Card-based layouts
-                'div[class*="match"]',
-                'div[class*="event"]',
-                'div[class*="game"]',
-                'div[class*="fixture"]',
-                # List-based layouts
-                'li[class*="match"]',
-                'li[class*="event"]',
-                # Generic containers that might hold match data
-                'div[data-event-id]',
-                'div[data-match-id]',
-                '[class*="odds-row"]',
-                '[class*="betting-row"]'
-            ]
-            
-            match_elements = []
-            for selector in potential_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    logger.debug(f"Found {len(elements)} elements with selector: {selector}")
-                    match_elements.extend(elements)
+            content = await page.content()
+            soup = BeautifulSoup(content, _SOUP_PARSER, parse_only=_CONTENT_STRAINER)
             
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_elements = []
-            for elem in match_elements:
-                elem_id = id(elem)
-                if elem_id not in seen:
-                    seen.add(elem_id)
-                    unique_elements.append(elem)
+            # One selector union walks the tree once and yields unique elements in document order
+            unique_elements = soup.select(_MATCH_SELECTOR, limit=20)
             
             logger.info(f"Found {len(unique_elements)} potential match elements in {league_name}")
             
-            # Parse each potential match element
-            for element in unique_elements[:20]:  # Limit to first 20 to avoid overprocessing
+            # Parse each potential match element (select() stops at 20 to avoid overprocessing)
+            for element in unique_elements:
                 try:
                     event = await self._parse_match_element(element, league_name, league_url)
                     if event:
@@ -212,43 +355,28 @@ class Tipp3RealScraper(BaseBookmakerScraper):
             
             # Strategy 2: Look for team names in the element text
             if not home_team or not away_team:
-                # Common patterns for team vs team
-                vs_patterns = [
-                    r'(.+?)\s*[-–]\s*(.+?)(?:\s|$)',
-                    r'(.+?)\s*vs\s*(.+?)(?:\s|$)',
-                    r'(.+?)\s*gegen\s*(.+?)(?:\s|$)',
-                    r'(.+?)\s*:\s*(.+?)(?:\s|$)'
-                ]
-                
-                for pattern in vs_patterns:
-                    match = re.search(pattern, text_content, re.IGNORECASE)
-                    if match:
-                        potential_home = match.group(1).strip()
-                        potential_away = match.group(2).strip()
-                        
-                        # Clean up team names (remove odds, dates, etc.)
-                        potential_home = re.sub(r'\d+\.\d+|\d{1,2}[./]\d{1,2}|\d{1,2}:\d{2}', '', potential_home).strip()
-                        potential_away = re.sub(r'\d+\.\d+|\d{1,2}[./]\d{1,2}|\d{1,2}:\d{2}', '', potential_away).strip()
-                        
-                        # Check if they look like team names
-                        if (len(potential_home) >= 3 and len(potential_away) >= 3 and 
-                            not potential_home.isdigit() and not potential_away.isdigit() and
-                            not any(x in potential_home.lower() for x in ['quote', 'odds', 'wette']) and
-                            not any(x in potential_away.lower() for x in ['quote', 'odds', 'wette'])):
-                            home_team = self.normalize_team_name(potential_home)
-                            away_team = self.normalize_team_name(potential_away)
-                            break
+                for potential_home, potential_away in _team_name_candidates(text_content):
+                    # Clean up team names (remove odds, dates, etc.)
+                    potential_home = _TEAM_NAME_NOISE_RE.sub('', potential_home.strip()).strip()
+                    potential_away = _TEAM_NAME_NOISE_RE.sub('', potential_away.strip()).strip()
+                    
+                    # Check if they look like team names
+                    if (len(potential_home) >= 3 and len(potential_away) >= 3 and 
+                        not potential_home.isdigit() and not potential_away.isdigit() and
+                        not any(x in potential_home.lower() for x in ['quote', 'odds', 'wette']) and
+                        not any(x in potential_away.lower() for x in ['quote', 'odds', 'wette'])):
+                        home_team = self.normalize_team_name(potential_home)
+                        away_team = self.normalize_team_name(potential_away)
+                        break
+            
+            # Only create event if we found both teams; don't spend date parsing on anything else
+            if not home_team or not away_team:
+                return None
             
             # Strategy 3: Look for date/time information
             # Look for date patterns
-            date_patterns = [
-                r'\b(\d{1,2})[./](\d{1,2})[./](\d{2,4})\b',  # DD/MM/YYYY
-                r'\b(\d{1,2})\.(\d{1,2})\.\b',  # DD.MM.
-                r'\b(\d{1,2}):(\d{2})\b'  # HH:MM (time)
-            ]
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, text_content)
+            for pattern in _DATE_PATTERNS:
+                date_match = pattern.search(text_content)
                 if date_match:
                     try:
                         if len(date_match.groups()) >= 3:
@@ -271,17 +399,15 @@ class Tipp3RealScraper(BaseBookmakerScraper):
                     except (ValueError, IndexError):
                         continue
             
-            # Only create event if we found both teams
-            if home_team and away_team:
-                return ScrapedEvent(
-                    home_team=home_team,
-                    away_team=away_team,
-                    match_date=match_date,
-                    league=league_name,
-                    event_url=event_url or league_url,
-                    bookmaker_event_id=self._extract_event_id(event_url) if event_url else None,
-                    status="scheduled"
-                )
+            return ScrapedEvent(
+                home_team=home_team,
+                away_team=away_team,
+                match_date=match_date,
+                league=league_name,
+                event_url=event_url or league_url,
+                bookmaker_event_id=self._extract_event_id(event_url) if event_url else None,
+                status="scheduled"
+            )
             
         except Exception as e:
             logger.debug(f"Error parsing tipp3 match element: {e}")
@@ -293,7 +419,16 @@ class Tipp3RealScraper(BaseBookmakerScraper):
         if not event_url:
             return None
         
-        match = re.search(r'eventID=(\d+)', event_url)
+        # Literal split on the parameter name; the regex is only needed for odd URLs
+        # where the first "eventID=" is not followed by digits
+        _, sep, tail = event_url.partition('eventID=')
+        if not sep:
+            return None
+        event_id = tail[:len(tail) - len(tail.lstrip('0123456789'))]
+        if event_id:
+            return event_id
+        
+        match = _EVENT_ID_RE.search(event_url)
         return match.group(1) if match else None
     
     async def get_event_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
@@ -303,14 +438,24 @@ class Tipp3RealScraper(BaseBookmakerScraper):
             if event.event_url and 'eventdetails' in event.event_url:
                 logger.info(f"Getting detailed odds for {event.home_team} vs {event.away_team}")
                 
-                if not await self.safe_navigate(event.event_url):
-                    logger.warning(f"Could not navigate to event URL: {event.event_url}")
-                    return None
-                
-                # Wait for page to load
-                await self.page.wait_for_timeout(3000)
+                # Fast path: plain HTTP GET; only render with the browser if that yields no odds
+                content = await self.fetch_html(event.event_url)
+                if content:
+                    odds = await self._extract_detailed_odds(event, content)
+                    if odds:
+                        return odds
+                    logger.debug(f"No odds in static HTML for {event.event_url}, rendering with browser")
                 
-                return await self._extract_detailed_odds(event)
+                # Render on a pooled page so concurrent callers never share a navigation
+                async with self.pooled_page() as page:
+                    if not await self.safe_navigate(event.event_url, page=page):
+                        logger.warning(f"Could not navigate to event URL: {event.event_url}")
+                        return None
+                    
+                    # Wait for page to load
+                    await self._wait_for_odds(page)
+                    
+                    return await self._extract_detailed_odds(event, page=page)
             else:
                 # Try to extract odds from league page
                 logger.info(f"Extracting basic odds for {event.home_team} vs {event.away_team}")
@@ -321,11 +466,23 @@ class Tipp3RealScraper(BaseBookmakerScraper):
         
         return None
     
-    async def _extract_detailed_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
-        """Extract detailed odds from event details page"""
+    async def _extract_detailed_odds(self, event: ScrapedEvent, content: Optional[str] = None,
+                                     page: Optional[Page] = None) -> Optional[ScrapedOdds]:
+        """Extract detailed odds from event details page (or its already fetched HTML)"""
         try:
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            moneyline = None
+            if content is None:
+                page = page or self.page
+                # Live page: read the 1X2 candidates straight from the DOM. Without 1X2 odds nothing
+                # is returned, so the page is only serialized and parsed when they were found
+                for selector in _MONEYLINE_SELECTORS:
+                    moneyline = self._parse_moneyline(await page.locator(selector).all_text_contents())
+                    if moneyline:
+                        break
+                if not moneyline:
+                    return None
+                content = await page.content()
+            soup = BeautifulSoup(content, _SOUP_PARSER, parse_only=_CONTENT_STRAINER)
             
             odds_data = {
                 'home_odds': None,
@@ -341,57 +498,49 @@ class Tipp3RealScraper(BaseBookmakerScraper):
             }
             
             # Look for 1X2 odds (Moneyline)
-            moneyline_selectors = [
-                '[class*="moneyline"]',
-                '[class*="1x2"]',
-                '[class*="three-way"]',
-                'button[class*="odd"]',
-                '.bet-button',
-                '[data-bet-type*="1x2"]'
-            ]
+            if moneyline is None:
+                for selector in _MONEYLINE_SELECTORS:
+                    moneyline = self._parse_moneyline([elem.get_text() for elem in soup.select(selector, limit=3)])
+                    if moneyline:
+                        break
             
-            for selector in moneyline_selectors:
-                elements = soup.select(selector)
-                if len(elements) >= 3:
-                    try:
-                        odds_texts = [elem.get_text().strip() for elem in elements[:3]]
-                        odds_values = [self.normalize_odds_value(text) for text in odds_texts]
-                        
-                        if all(v is not None for v in odds_values):
-                            odds_data['home_odds'] = odds_values[0]
-                            odds_data['draw_odds'] = odds_values[1]
-                            odds_data['away_odds'] = odds_values[2]
-                            logger.debug(f"Found 1X2 odds: {odds_values}")
-                            break
-                    except:
-                        continue
+            if moneyline:
+                odds_data['home_odds'], odds_data['draw_odds'], odds_data['away_odds'] = moneyline
+                logger.debug(f"Found 1X2 odds: {moneyline}")
+            
+            # Lowercased text of label parents; several labels often share one parent
+            parent_texts: Dict[int, str] = {}
             
-            # Look for BTTS (Both Teams to Score)
-            btts_elements = soup.find_all(text=re.compile(r'beide.*tor|btts|both.*score', re.IGNORECASE))
-            for btts_elem in btts_elements:
-                parent = btts_elem.parent
-                if parent:
+            # BTTS, Over/Under and exact score labels are found in one pass over the text nodes
+            for label in soup.find_all(string=_MARKET_LABEL_RE):
+                parent = label.parent
+                if not parent:
+                    continue
+                
+                # Look for BTTS (Both Teams to Score)
+                if _BTTS_LABEL_RE.search(label):
                     # Look for odds near this element
-                    odds_elements = parent.find_all_next(['button', 'span', 'div'], limit=5)
+                    odds_elements = parent.find_all_next(_ODDS_CANDIDATE_STRAINER, limit=5)
                     for odds_elem in odds_elements:
-                        odds_text = odds_elem.get_text().strip()
-                        if re.match(r'\d+\.\d{2}', odds_text):
-                            odds_value = self.normalize_odds_value(odds_text)
+                        odds_text = odds_elem.get_text()
+                        odds_stripped = odds_text.strip()
+                        if _ODDS_VALUE_RE.match(odds_stripped):
+                            odds_value = self.normalize_odds_value(odds_stripped)
                             if odds_value:
-                                if 'ja' in odds_elem.get_text().lower() or 'yes' in odds_elem.get_text().lower():
+                                odds_lower = odds_text.lower()
+                                if 'ja' in odds_lower or 'yes' in odds_lower:
                                     odds_data['btts_yes'] = odds_value
-                                elif 'nein' in odds_elem.get_text().lower() or 'no' in odds_elem.get_text().lower():
+                                elif 'nein' in odds_lower or 'no' in odds_lower:
                                     odds_data['btts_no'] = odds_value
-            
-            # Look for Over/Under 2.5 and 3.5
-            ou_elements = soup.find_all(text=re.compile(r'über|under|over|2\.?5|3\.?5', re.IGNORECASE))
-            for ou_elem in ou_elements:
-                parent = ou_elem.parent
-                if parent:
-                    text = parent.get_text().lower()
+                
+                # Look for Over/Under 2.5 and 3.5
+                if _OU_LABEL_RE.search(label):
+                    text = parent_texts.get(id(parent))
+                    if text is None:
+                        text = parent_texts[id(parent)] = parent.get_text().lower()
                     if '2.5' in text or '2,5' in text:
                         # Look for odds near this element
-                        odds_elements = parent.find_all_next(['button', 'span', 'div'], limit=3)
+                        odds_elements = parent.find_all_next(_ODDS_CANDIDATE_STRAINER, limit=3)
                         for odds_elem in odds_elements:
                             odds_text = odds_elem.get_text().strip()
                             odds_value = self.normalize_odds_value(odds_text)
@@ -402,7 +551,7 @@ class Tipp3RealScraper(BaseBookmakerScraper):
                                     odds_data['under_25'] = odds_value
                     elif '3.5' in text or '3,5' in text:
                         # Similar for 3.5
-                        odds_elements = parent.find_all_next(['button', 'span', 'div'], limit=3)
+                        odds_elements = parent.find_all_next(_ODDS_CANDIDATE_STRAINER, limit=3)
                         for odds_elem in odds_elements:
                             odds_text = odds_elem.get_text().strip()
                             odds_value = self.normalize_odds_value(odds_text)
@@ -411,27 +560,23 @@ class Tipp3RealScraper(BaseBookmakerScraper):
                                     odds_data['over_35'] = odds_value
                                 elif 'unter' in text or 'under' in text:
                                     odds_data['under_35'] = odds_value
-            
-            # Look for exact scores (Resultatwette)
-            exact_score_elements = soup.find_all(text=re.compile(r'resultat|exact.*score|endstand', re.IGNORECASE))
-            for score_elem in exact_score_elements:
-                parent = score_elem.parent
-                if parent:
-                    # Look for score patterns like "1:0", "2:1", etc.
-                    score_buttons = parent.find_all_next(['button', 'span', 'div'], limit=20)
-                    for button in score_buttons:
-                        button_text = button.get_text().strip()
-                        score_match = re.match(r'(\d+):(\d+)', button_text)
-                        if score_match:
-                            score = f"{score_match.group(1)}:{score_match.group(2)}"
-                            # Look for odds near this score
-                            odds_text = button.get('data-odds') or button.get_text()
-                            if odds_text:
-                                odds_match = re.search(r'(\d+\.\d{2})', odds_text)
-                                if odds_match:
-                                    odds_value = self.normalize_odds_value(odds_match.group(1))
-                                    if odds_value:
-                                        odds_data['exact_scores'][score] = odds_value
+                
+                # Look for exact scores (Resultatwette)
+                if _EXACT_SCORE_LABEL_RE.search(label):
+                    # Look for score patterns like "1:0 7.50" in the text following the label, in one scan
+                    score_strings = parent.find_all_next(string=True, limit=_SCORE_WINDOW_STRINGS)
+                    odds_data['exact_scores'].update(
+                        (score, float(odds)) for score, odds in _SCORE_ODDS_RE.findall(' '.join(score_strings))
+                    )
+                    # Score buttons may carry their odds in a data attribute instead
+                    for score_string in score_strings:
+                        odds_attr = score_string.parent.get('data-odds')
+                        if odds_attr:
+                            score_match = _SCORE_RE.match(score_string.strip())
+                            odds_match = _DECIMAL_ODDS_RE.search(odds_attr)
+                            if score_match and odds_match:
+                                score = f"{score_match.group(1)}:{score_match.group(2)}"
+                                odds_data['exact_scores'][score] = float(odds_match.group(1))
             
             # Create ScrapedOdds object if we found some odds
             if any(v is not None for v in [odds_data['home_odds'], odds_data['draw_odds'], odds_data['away_odds']]):
@@ -443,18 +588,16 @@ class Tipp3RealScraper(BaseBookmakerScraper):
                     draw_odds=odds_data['draw_odds'],
                     away_odds=odds_data['away_odds'],
                     league=event.league,
-                    match_url=event.event_url
+                    match_url=event.event_url,
+                    btts_yes=odds_data['btts_yes'],
+                    btts_no=odds_data['btts_no'],
+                    over_25=odds_data['over_25'],
+                    under_25=odds_data['under_25'],
+                    over_35=odds_data['over_35'],
+                    under_35=odds_data['under_35'],
+                    exact_scores=odds_data['exact_scores']
                 )
                 
-                # Add additional odds data as custom attributes
-                scraped_odds.btts_yes = odds_data['btts_yes']
-                scraped_odds.btts_no = odds_data['btts_no'] 
-                scraped_odds.over_25 = odds_data['over_25']
-                scraped_odds.under_25 = odds_data['under_25']
-                scraped_odds.over_35 = odds_data['over_35']
-                scraped_odds.under_35 = odds_data['under_35']
-                scraped_odds.exact_scores = odds_data['exact_scores']
-                
                 logger.info(f"Extracted detailed odds for {event.home_team} vs {event.away_team}")
                 logger.debug(f"1X2: {odds_data['home_odds']}-{odds_data['draw_odds']}-{odds_data['away_odds']}")
                 
@@ -465,11 +608,21 @@ class Tipp3RealScraper(BaseBookmakerScraper):
         
         return None
     
+    def _parse_moneyline(self, odds_texts: List[str]) -> Optional[List[float]]:
+        """Parse 1X2 odds from the first three texts matched by a moneyline selector"""
+        if len(odds_texts) < 3:
+            return None
+        try:
+            odds_values = [self.normalize_odds_value(text.strip()) for text in odds_texts[:3]]
+        except Exception:
+            return None
+        return odds_values if all(v is not None for v in odds_values) else None
+    
     async def _extract_basic_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
         """Extract basic 1X2 odds from league page"""
         try:
             content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, _SOUP_PARSER)
             
             # This is a simplified version that looks for odds in the current page
             # In a real implementation, you'd need to find the specific row/element 
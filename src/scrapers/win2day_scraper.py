@@ -1,14 +1,98 @@
 import re
-from typing import List, Optional
+import asyncio
+from functools import lru_cache
+from typing import List, Optional, Dict, ClassVar
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
+from playwright.async_api import Page
 from scrapers.base_scraper import BaseBookmakerScraper, ScrapedEvent, ScrapedOdds
 from loguru import logger
 
+# C-backed parser for BeautifulSoup; requires lxml
+_SOUP_PARSER = 'lxml'
+
+# Match/event containers: a tag whose class mentions one of the keywords (case-insensitively)
+_CONTAINER_SELECTOR = ', '.join(
+    f'{tag}[class*="{keyword}" i]'
+    for tag, keywords in (
+        ('div', ['match', 'event', 'game', 'fixture', 'wette']),
+        ('tr', ['match', 'event', 'game', 'fixture', 'odd']),
+        ('li', ['match', 'event', 'game', 'fixture']),
+        ('article', ['match', 'event', 'game']),
+    )
+    for keyword in keywords
+)
+# Elements with odds-like classes
+_ODDS_SELECTOR = ', '.join(
+    f'{tag}[class*="{keyword}" i]'
+    for tag in ('div', 'span', 'td', 'button')
+    for keyword in ('odd', 'quote', 'coefficient', 'bet')
+)
+
+# Look for team vs team patterns, each with the literal separator it needs in the (lowercased) text
+_VS_PATTERNS = [
+    ('vs', re.compile(r'(.+?)\s+vs\s+(.+?)(?:\s|$)', re.IGNORECASE)),
+    ('-', re.compile(r'(.+?)\s+-\s+(.+?)(?:\s|$)', re.IGNORECASE)),
+    ('gegen', re.compile(r'(.+?)\s+gegen\s+(.+?)(?:\s|$)', re.IGNORECASE)),
+    (':', re.compile(r'(.+?)\s+:\s+(.+?)(?:\s|$)', re.IGNORECASE)),
+    ('@', re.compile(r'(.+?)\s+@\s+(.+?)(?:\s|$)', re.IGNORECASE))
+]
+# Dates (with their trailing dot or year), odds and times that leak into team names
+_TEAM_NAME_NOISE_RE = re.compile(r'\d{1,2}[./]\d{1,2}(?:[./](?:\d{2,4}\b)?)?|\d+\.\d+|\d{1,2}:\d{2}')
+# Short dates need a slash or a trailing dot, so decimal odds like 2.10 are never read as dates
+_DATE_PATTERNS = [
+    re.compile(r'\b(\d{1,2})[./](\d{1,2})[./](\d{2,4})\b'),  # DD/MM/YYYY or DD.MM.YYYY
+    re.compile(r'\b(\d{1,2})/(\d{1,2})\b'),  # DD/MM (current year)
+    re.compile(r'\b(\d{1,2})\.(\d{1,2})\.(?!\d)')  # DD.MM. (current year)
+]
+# Find all text that looks like odds (format: X.XX)
+_ODDS_RE = re.compile(r'\b(\d{1,2}\.\d{2})\b')
+# Typical football team names, for pages without recognisable match containers
+_TEAM_NAME_RE = re.compile(r'(Real|Barcelona|Bayern|Dortmund|Chelsea|Arsenal|Liverpool|Manchester|Juventus|Milan|Inter|Austria|Rapid|Salzburg)', re.IGNORECASE)
+
+# Common team name normalizations for Austrian context
+_TEAM_NAME_MAPPINGS = {
+    # Austrian teams
+    "FK Austria Wien": "Austria Wien", 
+    "FK Austria Vienna": "Austria Wien",
+    "SK Rapid Wien": "Rapid Wien",
+    "Rapid Vienna": "Rapid Wien",
+    "RB Salzburg": "Red Bull Salzburg",
+    "FC Red Bull Salzburg": "Red Bull Salzburg",
+    "Salzburg": "Red Bull Salzburg",
+    # Common abbreviations
+    "Austria W.": "Austria Wien",
+    "Rapid W.": "Rapid Wien",
+}
+
+# Remove common prefixes/suffixes
+_TEAM_PREFIXES = frozenset({"FC", "FK", "SK", "SV", "1.", "TSV", "VfB", "VfL", "SSC", "AC", "AS"})
+_TEAM_SUFFIXES = frozenset({"e.V.", "1919", "1909", "1896", "Wien", "Vienna"})
+
+
+@lru_cache(maxsize=4096)
+def _normalize_team_name(cleaned: str) -> str:
+    """Normalize a stripped team name; teams recur across fixtures, so results are memoized"""
+    # Apply specific mappings
+    if cleaned in _TEAM_NAME_MAPPINGS:
+        cleaned = _TEAM_NAME_MAPPINGS[cleaned]
+    
+    words = cleaned.split()
+    # Remove prefixes
+    if words and words[0] in _TEAM_PREFIXES:
+        words = words[1:]
+    # Remove suffixes
+    if words and words[-1] in _TEAM_SUFFIXES:
+        words = words[:-1]
+    
+    return " ".join(words).strip()
+
 
 class Win2DayScraper(BaseBookmakerScraper):
     """Scraper for win2day Austria sports betting"""
     
+    team_name_mappings: ClassVar[Dict[str, str]] = _TEAM_NAME_MAPPINGS
+    
     def __init__(self):
         super().__init__(
             bookmaker_name="win2day", 
@@ -17,20 +101,12 @@ class Win2DayScraper(BaseBookmakerScraper):
         )
         self.sports_url = f"{self.base_url}/sportwetten"
         
-        # Common team name normalizations for Austrian context
-        self.team_name_mappings = {
-            # Austrian teams
-            "FK Austria Wien": "Austria Wien", 
-            "FK Austria Vienna": "Austria Wien",
-            "SK Rapid Wien": "Rapid Wien",
-            "Rapid Vienna": "Rapid Wien",
-            "RB Salzburg": "Red Bull Salzburg",
-            "FC Red Bull Salzburg": "Red Bull Salzburg",
-            "Salzburg": "Red Bull Salzburg",
-            # Common abbreviations
-            "Austria W.": "Austria Wien",
-            "Rapid W.": "Rapid Wien",
-        }
+        # Event pages loaded at once by get_event_odds_batch, each on a pooled context
+        self.max_concurrency = 4
+        self.context_pool_size = self.max_concurrency
+        
+        # Event pages whose odds are server-rendered are fetched over plain HTTP first
+        self.http_concurrency = self.max_concurrency
     
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team names for consistent matching"""
@@ -38,25 +114,7 @@ class Win2DayScraper(BaseBookmakerScraper):
             return ""
         
         # Clean up the name
-        cleaned = team_name.strip()
-        
-        # Apply specific mappings
-        if cleaned in self.team_name_mappings:
-            cleaned = self.team_name_mappings[cleaned]
-        
-        # Remove common prefixes/suffixes
-        prefixes_to_remove = ["FC", "FK", "SK", "SV", "1.", "TSV", "VfB", "VfL", "SSC", "AC", "AS"]
-        suffixes_to_remove = ["e.V.", "1919", "1909", "1896", "Wien", "Vienna"]
-        
-        words = cleaned.split()
-        # Remove prefixes
-        if words and words[0] in prefixes_to_remove:
-            words = words[1:]
-        # Remove suffixes
-        if words and words[-1] in suffixes_to_remove:
-            words = words[:-1]
-        
-        return " ".join(words).strip()
+        return _normalize_team_name(team_name.strip())
     
     async def get_football_events(self, leagues: List[str] = None) -> List[ScrapedEvent]:
         """Scrape upcoming football events from win2day"""
@@ -98,32 +156,18 @@ class Win2DayScraper(BaseBookmakerScraper):
             
             # Get page content and parse with BeautifulSoup
             content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(content, _SOUP_PARSER)
             
             # Look for match/event containers with various possible structures
-            potential_containers = []
-            
-            # Try different selectors that might contain match information
-            container_selectors = [
-                {'tag': 'div', 'class_contains': ['match', 'event', 'game', 'fixture', 'wette']},
-                {'tag': 'tr', 'class_contains': ['match', 'event', 'game', 'fixture', 'odd']},
-                {'tag': 'li', 'class_contains': ['match', 'event', 'game', 'fixture']},
-                {'tag': 'article', 'class_contains': ['match', 'event', 'game']},
-            ]
-            
-            for selector in container_selectors:
-                elements = soup.find_all(
-                    selector['tag'], 
-                    class_=lambda x: x and any(keyword in x.lower() for keyword in selector['class_contains'])
-                )
-                potential_containers.extend(elements)
+            potential_containers = soup.select(_CONTAINER_SELECTOR, limit=20)
             
             # If no specific containers found, look for elements containing team names
             if not potential_containers:
                 # Look for elements containing typical football team patterns
-                team_pattern = re.compile(r'(Real|Barcelona|Bayern|Dortmund|Chelsea|Arsenal|Liverpool|Manchester|Juventus|Milan|Inter|Austria|Rapid|Salzburg)', re.IGNORECASE)
-                potential_containers = soup.find_all(text=team_pattern)
-                potential_containers = [elem.parent for elem in potential_containers if elem.parent]
+                # Several matching strings can share a parent, so keep each parent once
+                # (the select above already yields every element at most once)
+                team_texts = soup.find_all(text=_TEAM_NAME_RE)
+                potential_containers = list({id(elem.parent): elem.parent for elem in team_texts if elem.parent}.values())
             
             logger.info(f"Found {len(potential_containers)} potential match containers on win2day")
             
@@ -152,27 +196,24 @@ class Win2DayScraper(BaseBookmakerScraper):
             if len(text_content) < 10:  # Too short to contain meaningful match info
                 return None
             
-            # Look for team vs team patterns
-            vs_patterns = [
-                r'(.+?)\s+vs\s+(.+?)(?:\s|$)',
-                r'(.+?)\s+-\s+(.+?)(?:\s|$)', 
-                r'(.+?)\s+gegen\s+(.+?)(?:\s|$)',
-                r'(.+?)\s+:\s+(.+?)(?:\s|$)',
-                r'(.+?)\s+@\s+(.+?)(?:\s|$)'
-            ]
+            # Cheap substring checks rule out containers without any team separator
+            text_lower = text_content.lower()
+            patterns = [pattern for separator, pattern in _VS_PATTERNS if separator in text_lower]
+            if not patterns:
+                return None
             
             home_team = ""
             away_team = ""
             
-            for pattern in vs_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
+            for pattern in patterns:
+                match = pattern.search(text_content)
                 if match:
                     potential_home = match.group(1).strip()
                     potential_away = match.group(2).strip()
                     
                     # Clean up team names (remove odds, dates, etc.)
-                    potential_home = re.sub(r'\\d+\\.\\d+|\\d{1,2}[./]\\d{1,2}|\\d{1,2}:\\d{2}', '', potential_home).strip()
-                    potential_away = re.sub(r'\\d+\\.\\d+|\\d{1,2}[./]\\d{1,2}|\\d{1,2}:\\d{2}', '', potential_away).strip()
+                    potential_home = _TEAM_NAME_NOISE_RE.sub('', potential_home).strip()
+                    potential_away = _TEAM_NAME_NOISE_RE.sub('', potential_away).strip()
                     
                     # Check if they look like team names (at least 3 characters, not just numbers)
                     if (len(potential_home) >= 3 and len(potential_away) >= 3 and 
@@ -188,14 +229,8 @@ class Win2DayScraper(BaseBookmakerScraper):
             match_date = datetime.now() + timedelta(days=1)  # Default to tomorrow
             
             # Look for date patterns in the container
-            date_patterns = [
-                r'\\b(\\d{1,2})[./](\\d{1,2})[./](\\d{2,4})\\b',  # DD/MM/YYYY or DD.MM.YYYY
-                r'\\b(\\d{1,2})[./](\\d{1,2})\\b',  # DD/MM (current year)
-                r'\\b(\\d{1,2})\\.(\\d{1,2})\\.\\b'  # DD.MM.
-            ]
-            
-            for pattern in date_patterns:
-                date_match = re.search(pattern, text_content)
+            for pattern in _DATE_PATTERNS:
+                date_match = pattern.search(text_content)
                 if date_match:
                     try:
                         day = int(date_match.group(1))
@@ -236,53 +271,73 @@ class Win2DayScraper(BaseBookmakerScraper):
             logger.debug(f"Error parsing win2day event: {e}")
             return None
     
-    async def get_event_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
+    async def get_event_odds(self, event: ScrapedEvent, page: Optional[Page] = None) -> Optional[ScrapedOdds]:
         """Get odds for a specific event from win2day"""
         try:
-            # Navigate to event-specific page if available
-            if event.event_url and event.event_url != self.sports_url:
-                if not await self.safe_navigate(event.event_url):
-                    logger.warning(f"Could not navigate to event URL: {event.event_url}")
-                    return None
+            # A fresh page from the pool also has to load the sports overview itself
+            if event.event_url and (page or event.event_url != self.sports_url):
+                odds = await self._fetch_static_odds(event)
+                if odds:
+                    return odds
             
-            # Get page content
-            content = await self.page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            return await self._render_event_odds(event, page)
+            
+        except Exception as e:
+            logger.error(f"Error getting win2day odds: {e}")
+        
+        return None
+    
+    async def _fetch_static_odds(self, event: ScrapedEvent) -> Optional[ScrapedOdds]:
+        """Fast path: read odds from a plain HTTP GET of the event page, without the browser"""
+        content = await self.fetch_html(event.event_url)
+        if content and _ODDS_RE.search(content):
+            odds = self._parse_event_odds(event, content)
+            if odds:
+                return odds
+            logger.debug(f"No odds in static HTML for {event.event_url}, rendering with browser")
+        return None
+    
+    async def _render_event_odds(self, event: ScrapedEvent, page: Optional[Page] = None) -> Optional[ScrapedOdds]:
+        """Load the event page in the browser (unless self.page already shows it) and parse its odds"""
+        if event.event_url and (page or event.event_url != self.sports_url):
+            if not await self.safe_navigate(event.event_url, page=page):
+                logger.warning(f"Could not navigate to event URL: {event.event_url}")
+                return None
+        
+        content = await (page or self.page).content()
+        return self._parse_event_odds(event, content)
+    
+    def _parse_event_odds(self, event: ScrapedEvent, content: str) -> Optional[ScrapedOdds]:
+        """Read 1X2 odds from an event page's HTML"""
+        try:
+            soup = BeautifulSoup(content, _SOUP_PARSER)
             
-            # Look for odds with various strategies
-            odds_values = []
+            # Look for odds with various strategies; the dict dedupes while preserving order
+            odds_values = {}
             
             # Strategy 1: Look for elements with odds-like classes
-            odds_containers = soup.find_all(['div', 'span', 'td', 'button'], 
-                                         class_=lambda x: x and any(keyword in x.lower() for keyword in ['odd', 'quote', 'coefficient', 'bet']))
-            
-            for container in odds_containers:
-                text = container.get_text().strip()
-                odds_value = self.normalize_odds_value(text)
+            for container in soup.select(_ODDS_SELECTOR):
+                odds_value = self.normalize_odds_value(container.get_text().strip())
                 if odds_value and 1.01 <= odds_value <= 50.0:
-                    odds_values.append(odds_value)
+                    odds_values[odds_value] = None
+                    if len(odds_values) >= 3:
+                        break
             
-            # Strategy 2: Look for numeric patterns that could be odds
+            # Strategy 2: Look for numeric patterns that could be odds, scanning the
+            # main content strings lazily instead of serializing the whole page
             if len(odds_values) < 3:
-                # Find all text that looks like odds (format: X.XX)
-                odds_pattern = re.compile(r'\\b(\\d{1,2}\\.\\d{2})\\b')
-                all_text = soup.get_text()
-                potential_odds = odds_pattern.findall(all_text)
-                
-                for odds_str in potential_odds:
-                    odds_value = self.normalize_odds_value(odds_str)
-                    if odds_value and 1.01 <= odds_value <= 50.0:
-                        odds_values.append(odds_value)
-            
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_odds = []
-            for odds in odds_values:
-                if odds not in seen:
-                    seen.add(odds)
-                    unique_odds.append(odds)
+                scope = soup.find('main') or soup.body or soup
+                for text in scope.strings:
+                    for match in _ODDS_RE.finditer(text):
+                        odds_value = self.normalize_odds_value(match.group())
+                        if odds_value and 1.01 <= odds_value <= 50.0:
+                            odds_values[odds_value] = None
+                            if len(odds_values) >= 3:
+                                break
+                    if len(odds_values) >= 3:
+                        break
             
-            odds_values = unique_odds[:3]  # Take first 3 unique odds
+            odds_values = list(odds_values)[:3]  # Take first 3 unique odds
             
             # Assign odds (assuming 1X2 format: Home, Draw, Away)
             home_odds = None
@@ -314,6 +369,29 @@ class Win2DayScraper(BaseBookmakerScraper):
                 )
             
         except Exception as e:
-            logger.error(f"Error getting win2day odds: {e}")
+            logger.error(f"Error parsing win2day odds: {e}")
         
         return None
+    
+    async def get_event_odds_batch(self, events: List[ScrapedEvent]) -> List[Optional[ScrapedOdds]]:
+        """Get odds for several events concurrently, borrowing a pooled page only when static HTML has no odds"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def get_bounded(event: ScrapedEvent) -> Optional[ScrapedOdds]:
+            async with semaphore:
+                odds = await self._fetch_static_odds(event) if event.event_url else None
+                if odds:
+                    return odds
+                async with self.pooled_page() as page:
+                    return await self._render_event_odds(event, page)
+        
+        results = await asyncio.gather(*[get_bounded(event) for event in events], return_exceptions=True)
+        
+        odds = []
+        for event, result in zip(events, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error getting win2day odds for {event.home_team} vs {event.away_team}: {result}")
+                result = None
+            odds.append(result)
+        
+        return odds
@@ -4,20 +4,46 @@ Using football-data.org free tier (10 requests per minute, no API key required)
 """
 import aiohttp
 import asyncio
-from typing import List, Dict, Optional, Tuple
+import json
+import os
+import time
+from collections import deque
+from typing import List, Dict, Optional, Tuple, Deque
 from datetime import datetime, timedelta
+import numpy as np
+from rapidfuzz import fuzz, process
 from loguru import logger
-from fuzzywuzzy import fuzz
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, aiohttp's stdlib json decoding is used instead
+    orjson = None
+
+# Remove common prefixes and suffixes
+_TEAM_PREFIXES = frozenset({"FC", "AC", "AS", "SK", "FK", "SV", "1.", "TSV", "VfB", "VfL", "SSC", "CF"})
+_TEAM_SUFFIXES = frozenset({"FC", "e.V.", "1919", "1909", "1896", "Wien", "Vienna", "Munich", "München"})
+
+
+def _blocking_key(normalized_name: str) -> str:
+    """First token of a normalized team name, used to prefilter fuzzy-match candidates"""
+    return normalized_name.split(maxsplit=1)[0].lower() if normalized_name else ""
 
 
 class FreeSportsAPI:
     """Free sports data API client using football-data.org"""
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None):
         self.base_url = "https://api.football-data.org/v4"
         self.session: Optional[aiohttp.ClientSession] = None
-        self.request_count = 0
-        self.last_request_time = datetime.now()
+        
+        # Sliding-window rate limit: at most rate_limit requests in any rate_window seconds,
+        # with up to max_concurrency of them in flight
+        self.rate_limit = 10
+        self.rate_window = 60.0
+        self.max_concurrency = 5
+        self._request_times: Deque[float] = deque()
+        self._rate_lock = asyncio.Lock()
+        self._request_slots = asyncio.Semaphore(self.max_concurrency)
         
         # Austrian-relevant competition IDs (free tier)
         self.competition_ids = {
@@ -33,14 +59,27 @@ class FreeSportsAPI:
         # Team name normalization cache
         self.team_cache = {}
         self.match_cache = {}
+        # (matches, home first-token index, away first-token index), rebuilt after match_cache changes
+        self._match_index: Optional[Tuple[List[Dict], Dict[str, List[int]], Dict[str, List[int]]]] = None
+        
+        # Optional JSON file that keeps API responses (endpoint -> (fetched_at, data)) across runs,
+        # so a warm restart doesn't spend the rate limit; disabled unless a path is set
+        self.cache_path = cache_path
+        self.response_ttl = 600
+        self._response_cache: Dict[str, Tuple[float, Dict]] = {}
     
     async def __aenter__(self):
         """Async context manager entry"""
+        self._load_disk_cache()
+        # Pooled keep-alive connections so concurrent competition requests reuse sockets
         self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60),
             headers={
                 "User-Agent": "OddsChecker Austria/1.0",
-                "Accept": "application/json"
-            }
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip, deflate"
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
         )
         return self
     
@@ -48,45 +87,95 @@ class FreeSportsAPI:
         """Async context manager exit"""
         if self.session:
             await self.session.close()
+        self._save_disk_cache()
     
-    async def _rate_limit(self):
-        """Simple rate limiting for free tier (10 requests per minute)"""
-        now = datetime.now()
-        time_since_last = (now - self.last_request_time).total_seconds()
+    def _load_disk_cache(self):
+        """Load unexpired API responses saved by a previous run"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
         
-        if self.request_count >= 10:
-            if time_since_last < 60:  # Less than 1 minute since we hit the limit
-                sleep_time = 60 - time_since_last + 1
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = orjson.loads(f.read()) if orjson else json.load(f)
+            
+            now = time.time()
+            for endpoint, (fetched_at, data) in cached.get('responses', {}).items():
+                if now - fetched_at < self.response_ttl:
+                    self._response_cache.setdefault(endpoint, (fetched_at, data))
+            logger.debug(f"Loaded {len(self._response_cache)} cached API responses from {self.cache_path}")
+        except Exception as e:
+            logger.warning(f"Could not load sports API cache from {self.cache_path}: {e}")
+    
+    def _save_disk_cache(self):
+        """Write unexpired API responses to cache_path"""
+        if not self.cache_path:
+            return
+        
+        now = time.time()
+        # team_cache is not persisted, so changes to the prefix/suffix rules apply to every name
+        cached = {
+            'responses': {endpoint: entry for endpoint, entry in self._response_cache.items()
+                          if now - entry[0] < self.response_ttl},
+        }
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            # Write to a temporary file first so a crash never leaves a truncated cache behind
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(cached) if orjson else json.dumps(cached).encode())
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Could not save sports API cache to {self.cache_path}: {e}")
+    
+    async def _rate_limit(self):
+        """Sliding-window rate limiting for free tier (10 requests per minute)"""
+        # Waiters queue on the lock, so request slots are handed out in arrival order
+        async with self._rate_lock:
+            now = time.monotonic()
+            while self._request_times and now - self._request_times[0] >= self.rate_window:
+                self._request_times.popleft()
+            
+            if len(self._request_times) >= self.rate_limit:
+                sleep_time = self.rate_window - (now - self._request_times[0])
                 logger.info(f"Rate limiting: sleeping for {sleep_time:.1f} seconds")
                 await asyncio.sleep(sleep_time)
-            self.request_count = 0
-        
-        self.last_request_time = now
-        self.request_count += 1
+                self._request_times.popleft()
+            
+            self._request_times.append(time.monotonic())
     
     async def _make_request(self, endpoint: str) -> Optional[Dict]:
         """Make rate-limited API request"""
-        await self._rate_limit()
-        
         url = f"{self.base_url}/{endpoint}"
         
-        try:
-            logger.debug(f"Making API request to: {url}")
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data
-                elif response.status == 429:  # Rate limited
-                    logger.warning("API rate limit exceeded, waiting...")
-                    await asyncio.sleep(60)
-                    return await self._make_request(endpoint)  # Retry
-                else:
-                    logger.warning(f"API request failed with status {response.status}")
-                    return None
+        cached = self._response_cache.get(endpoint)
+        if cached and time.time() - cached[0] < self.response_ttl:
+            logger.debug(f"Using cached API response for: {url}")
+            return cached[1]
+        
+        while True:
+            await self._rate_limit()
+            
+            try:
+                logger.debug(f"Making API request to: {url}")
+                async with self._request_slots, self.session.get(url) as response:
+                    if response.status == 200:
+                        if orjson:
+                            data = orjson.loads(await response.read())
+                        else:
+                            data = await response.json()
+                        self._response_cache[endpoint] = (time.time(), data)
+                        return data
+                    elif response.status != 429:
+                        logger.warning(f"API request failed with status {response.status}")
+                        return None
                     
-        except Exception as e:
-            logger.error(f"Error making API request to {url}: {e}")
-            return None
+            except Exception as e:
+                logger.error(f"Error making API request to {url}: {e}")
+                return None
+            
+            # Rate limited: wait outside the request slot, then retry
+            logger.warning("API rate limit exceeded, waiting...")
+            await asyncio.sleep(60)
     
     async def get_upcoming_matches(self, days_ahead: int = 7) -> List[Dict]:
         """Get upcoming matches from multiple leagues"""
@@ -99,45 +188,57 @@ class FreeSportsAPI:
         date_from = today.isoformat()
         date_to = end_date.isoformat()
         
-        # Get matches from multiple competitions
-        for comp_name, comp_id in self.competition_ids.items():
-            try:
-                endpoint = f"competitions/{comp_id}/matches?dateFrom={date_from}&dateTo={date_to}"
-                data = await self._make_request(endpoint)
-                
-                if data and 'matches' in data:
-                    matches = data['matches']
-                    logger.info(f"Found {len(matches)} matches in {comp_name}")
-                    
-                    for match in matches:
-                        # Normalize match data
-                        normalized_match = {
-                            'id': match.get('id'),
-                            'home_team': match['homeTeam']['name'],
-                            'away_team': match['awayTeam']['name'],
-                            'home_team_normalized': self.normalize_team_name(match['homeTeam']['name']),
-                            'away_team_normalized': self.normalize_team_name(match['awayTeam']['name']),
-                            'match_date': datetime.fromisoformat(match['utcDate'].replace('Z', '+00:00')),
-                            'competition': comp_name,
-                            'competition_id': comp_id,
-                            'status': match.get('status', 'SCHEDULED').lower()
-                        }
-                        all_matches.append(normalized_match)
-                        
-                        # Cache for later matching
-                        match_key = f"{normalized_match['home_team_normalized']}_{normalized_match['away_team_normalized']}"
-                        self.match_cache[match_key] = normalized_match
-                
-                # Small delay between competitions to be nice to the API
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error getting matches for {comp_name}: {e}")
+        # Get matches from multiple competitions concurrently; _make_request keeps within the rate limit
+        competitions = list(self.competition_ids.items())
+        results = await asyncio.gather(
+            *[self._fetch_competition_matches(comp_name, comp_id, date_from, date_to)
+              for comp_name, comp_id in competitions],
+            return_exceptions=True
+        )
+        
+        for (comp_name, comp_id), matches in zip(competitions, results):
+            if isinstance(matches, Exception):
+                logger.error(f"Error getting matches for {comp_name}: {matches}")
                 continue
+            
+            for normalized_match in matches:
+                all_matches.append(normalized_match)
+                
+                # Cache for later matching
+                match_key = f"{normalized_match['home_team_normalized']}_{normalized_match['away_team_normalized']}"
+                self.match_cache[match_key] = normalized_match
+        self._match_index = None
         
         logger.info(f"Total matches found: {len(all_matches)}")
         return all_matches
     
+    async def _fetch_competition_matches(self, comp_name: str, comp_id: str,
+                                         date_from: str, date_to: str) -> List[Dict]:
+        """Fetch and normalize one competition's matches in the date range"""
+        endpoint = f"competitions/{comp_id}/matches?dateFrom={date_from}&dateTo={date_to}"
+        data = await self._make_request(endpoint)
+        
+        normalized_matches = []
+        if data and 'matches' in data:
+            matches = data['matches']
+            logger.info(f"Found {len(matches)} matches in {comp_name}")
+            
+            for match in matches:
+                # Normalize match data
+                normalized_matches.append({
+                    'id': match.get('id'),
+                    'home_team': match['homeTeam']['name'],
+                    'away_team': match['awayTeam']['name'],
+                    'home_team_normalized': self.normalize_team_name(match['homeTeam']['name']),
+                    'away_team_normalized': self.normalize_team_name(match['awayTeam']['name']),
+                    'match_date': datetime.fromisoformat(match['utcDate'].replace('Z', '+00:00')),
+                    'competition': comp_name,
+                    'competition_id': comp_id,
+                    'status': match.get('status', 'SCHEDULED').lower()
+                })
+        
+        return normalized_matches
+    
     def normalize_team_name(self, team_name: str) -> str:
         """Normalize team name for matching"""
         if not team_name:
@@ -150,18 +251,14 @@ class FreeSportsAPI:
         # Basic normalization
         normalized = team_name.strip()
         
-        # Remove common prefixes and suffixes
-        prefixes = ["FC", "AC", "AS", "SK", "FK", "SV", "1.", "TSV", "VfB", "VfL", "SSC", "CF"]
-        suffixes = ["FC", "e.V.", "1919", "1909", "1896", "Wien", "Vienna", "Munich", "München"]
-        
         words = normalized.split()
         
         # Remove prefixes
-        if words and words[0] in prefixes:
+        if words and words[0] in _TEAM_PREFIXES:
             words = words[1:]
         
         # Remove suffixes
-        if words and words[-1] in suffixes:
+        if words and words[-1] in _TEAM_SUFFIXES:
             words = words[:-1]
         
         normalized = " ".join(words).strip()
@@ -176,31 +273,23 @@ class FreeSportsAPI:
         scraped_home_norm = self.normalize_team_name(scraped_home)
         scraped_away_norm = self.normalize_team_name(scraped_away)
         
-        best_match = None
-        best_score = 0
+        matches, home_idx, away_idx = self._get_match_index()
         
-        for match_key, api_match in self.match_cache.items():
-            # Calculate similarity scores
-            home_score = fuzz.ratio(scraped_home_norm, api_match['home_team_normalized'])
-            away_score = fuzz.ratio(scraped_away_norm, api_match['away_team_normalized'])
-            
-            # Try both directions (home/away might be swapped)
-            home_away_score = (home_score + away_score) / 2
-            
-            away_home_score = (
-                fuzz.ratio(scraped_home_norm, api_match['away_team_normalized']) +
-                fuzz.ratio(scraped_away_norm, api_match['home_team_normalized'])
-            ) / 2
-            
-            total_score = max(home_away_score, away_home_score)
-            
-            if total_score > best_score and total_score >= threshold:
-                best_score = total_score
-                best_match = {
-                    **api_match,
-                    'match_score': total_score,
-                    'swapped': away_home_score > home_away_score
-                }
+        # Score only matches sharing a first token with the scraped teams (in either
+        # orientation), and fall back to the full cache if none of them clears the threshold
+        home_key = _blocking_key(scraped_home_norm)
+        away_key = _blocking_key(scraped_away_norm)
+        candidate_ids = set()
+        for key, index in ((home_key, home_idx), (away_key, away_idx),
+                           (home_key, away_idx), (away_key, home_idx)):
+            candidate_ids.update(index.get(key, ()))
+        
+        best_match = None
+        if candidate_ids and len(candidate_ids) < len(matches):
+            candidates = [matches[i] for i in sorted(candidate_ids)]
+            best_match = self._score_candidates(candidates, scraped_home_norm, scraped_away_norm, threshold)
+        if best_match is None:
+            best_match = self._score_candidates(matches, scraped_home_norm, scraped_away_norm, threshold)
         
         if best_match:
             logger.debug(f"Found match for {scraped_home} vs {scraped_away}: "
@@ -209,6 +298,46 @@ class FreeSportsAPI:
         
         return best_match
     
+    def _get_match_index(self) -> Tuple[List[Dict], Dict[str, List[int]], Dict[str, List[int]]]:
+        """Build (once per match_cache refresh) the cached matches and their first-token indexes"""
+        if self._match_index is None:
+            matches = list(self.match_cache.values())
+            home_idx: Dict[str, List[int]] = {}
+            away_idx: Dict[str, List[int]] = {}
+            for i, match in enumerate(matches):
+                home_idx.setdefault(_blocking_key(match['home_team_normalized']), []).append(i)
+                away_idx.setdefault(_blocking_key(match['away_team_normalized']), []).append(i)
+            self._match_index = (matches, home_idx, away_idx)
+        return self._match_index
+    
+    def _score_candidates(self, candidates: List[Dict], scraped_home_norm: str,
+                          scraped_away_norm: str, threshold: int) -> Optional[Dict]:
+        """Score both scraped teams against all candidates in one rapidfuzz cdist call"""
+        if not candidates:
+            return None
+        
+        names = ([match['home_team_normalized'] for match in candidates] +
+                 [match['away_team_normalized'] for match in candidates])
+        
+        # Row 0: scraped home vs all names, row 1: scraped away vs all names
+        scores = process.cdist([scraped_home_norm, scraped_away_norm], names, scorer=fuzz.ratio)
+        count = len(candidates)
+        # Try both directions (home/away might be swapped)
+        home_away_scores = (scores[0, :count] + scores[1, count:]) / 2
+        away_home_scores = (scores[0, count:] + scores[1, :count]) / 2
+        total_scores = np.maximum(home_away_scores, away_home_scores)
+        
+        best = int(total_scores.argmax())
+        total_score = float(total_scores[best])
+        if total_score <= 0 or total_score < threshold:
+            return None
+        
+        return {
+            **candidates[best],
+            'match_score': total_score,
+            'swapped': bool(away_home_scores[best] > home_away_scores[best])
+        }
+    
     async def get_team_suggestions(self, partial_name: str, limit: int = 5) -> List[str]:
         """Get team name suggestions for a partial match"""
         suggestions = []
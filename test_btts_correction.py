@@ -2,14 +2,15 @@
 Test script for corrected BTTS extraction from event detail pages
 """
 import asyncio
+import json
 import sys
-import os
 from pathlib import Path
 from loguru import logger
 
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from log_setup import configure_logging
 from scrapers.tipp3_enhanced_scraper import Tipp3EnhancedScraper
 
 
@@ -40,7 +41,7 @@ async def test_btts_correction():
                 logger.info(f"\\n--- Event {i+1}: {event.home_team} vs {event.away_team} ---")
                 logger.info(f"Event ID: {event.bookmaker_event_id}")
                 
-                if hasattr(event, 'enhanced_odds_data'):
+                if event.enhanced_odds_data:
                     odds_data = event.enhanced_odds_data
                     
                     # Display 1X2 odds
@@ -69,14 +70,16 @@ async def test_btts_correction():
         logger.info("\\n💾 Saving corrected results to JSON...")
         json_filename = scraper.save_results_to_json("tipp3_btts_corrected_results.json")
         
-        if json_filename and os.path.exists(json_filename):
+        try:
+            with open(json_filename, encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, TypeError):
+            data = None
+        
+        if data is not None:
             logger.info(f"✅ JSON file created: {json_filename}")
             
             # Quick analysis of results
-            import json
-            with open(json_filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
             if data:
                 logger.info(f"📋 JSON contains {len(data)} event entries")
                 
@@ -110,8 +113,7 @@ async def test_btts_correction():
 
 if __name__ == "__main__":
     # Set up logging
-    logger.remove()
-    logger.add(sys.stderr, level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}")
+    configure_logging()
     
     try:
         asyncio.run(test_btts_correction())
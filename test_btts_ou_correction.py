@@ -10,6 +10,8 @@ from loguru import logger
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from log_setup import configure_logging
+from markets import log_markets, summarize_results
 from scrapers.tipp3_enhanced_scraper import Tipp3EnhancedScraper
 
 
@@ -37,109 +39,22 @@ async def test_btts_ou_correction():
             logger.info("\\n🔍 Testing BTTS and O/U Correction on First 3 Events:")
             
             for i, event in enumerate(events[:3]):
-                logger.info(f"\\n--- Event {i+1}: {event.home_team} vs {event.away_team} ---")
-                logger.info(f"Event ID: {event.bookmaker_event_id}")
+                logger.info("\\n--- Event {}: {} vs {} ---", i+1, event.home_team, event.away_team)
+                logger.info("Event ID: {}", event.bookmaker_event_id)
                 
-                if hasattr(event, 'enhanced_odds_data'):
+                if event.enhanced_odds_data:
                     odds_data = event.enhanced_odds_data
                     
-                    # Display 1X2 odds
-                    logger.info(f"🎯 1X2 Odds: {odds_data.get('home_odds')} - {odds_data.get('draw_odds')} - {odds_data.get('away_odds')}")
-                    
-                    # Check BTTS odds
-                    btts_yes = odds_data.get('btts_yes')
-                    btts_no = odds_data.get('btts_no')
-                    
-                    if btts_yes and btts_no:
-                        logger.info(f"✅ BTTS: Yes {btts_yes}, No {btts_no}")
-                    else:
-                        logger.warning(f"❌ BTTS odds missing: Yes {btts_yes}, No {btts_no}")
-                    
-                    # Check O/U 2.5 odds
-                    over_25 = odds_data.get('over_25')
-                    under_25 = odds_data.get('under_25')
-                    
-                    if over_25 and under_25:
-                        logger.info(f"✅ O/U 2.5: Over {over_25}, Under {under_25}")
-                    else:
-                        logger.warning(f"❌ O/U 2.5 odds missing: Over {over_25}, Under {under_25}")
-                    
-                    # Check O/U 3.5 odds
-                    over_35 = odds_data.get('over_35')
-                    under_35 = odds_data.get('under_35')
-                    
-                    if over_35 and under_35:
-                        logger.info(f"✅ O/U 3.5: Over {over_35}, Under {under_35}")
-                    else:
-                        logger.info(f"ℹ️  O/U 3.5 odds: Over {over_35}, Under {under_35}")
-                    
-                    # Check for additional O/U thresholds
-                    over_15 = odds_data.get('over_15')
-                    under_15 = odds_data.get('under_15')
-                    if over_15 and under_15:
-                        logger.info(f"✅ O/U 1.5: Over {over_15}, Under {under_15}")
-                    
-                    over_45 = odds_data.get('over_45')
-                    under_45 = odds_data.get('under_45')
-                    if over_45 and under_45:
-                        logger.info(f"✅ O/U 4.5: Over {over_45}, Under {under_45}")
+                    log_markets(odds_data)
         
-        # Save corrected results
-        logger.info("\\n💾 Saving corrected results to JSON...")
-        json_filename = scraper.save_results_to_json("tipp3_btts_ou_corrected_results.json")
+        # Quick analysis of the in-memory results; the JSON file is only written when SAVE_JSON is set
+        summarize_results(scraper.results_as_records())
         
-        if json_filename and os.path.exists(json_filename):
-            logger.info(f"✅ JSON file created: {json_filename}")
-            
-            # Quick analysis of results
-            import json
-            with open(json_filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if data:
-                logger.info(f"📋 JSON contains {len(data)} event entries")
-                
-                # Count how many have correct odds
-                btts_count = 0
-                ou25_count = 0
-                ou35_count = 0
-                ou15_count = 0
-                ou45_count = 0
-                
-                for entry in data:
-                    odds = entry.get('odds', {})
-                    if odds.get('btts_yes') and odds.get('btts_no'):
-                        btts_count += 1
-                    if odds.get('over_25') and odds.get('under_25'):
-                        ou25_count += 1
-                    if odds.get('over_35') and odds.get('under_35'):
-                        ou35_count += 1
-                    if odds.get('over_15') and odds.get('under_15'):
-                        ou15_count += 1
-                    if odds.get('over_45') and odds.get('under_45'):
-                        ou45_count += 1
-                
-                logger.info(f"\\n📊 Odds Extraction Success Rates:")
-                logger.info(f"   BTTS odds: {btts_count}/{len(data)} ({btts_count/len(data)*100:.1f}%)")
-                logger.info(f"   O/U 2.5 odds: {ou25_count}/{len(data)} ({ou25_count/len(data)*100:.1f}%)")
-                logger.info(f"   O/U 3.5 odds: {ou35_count}/{len(data)} ({ou35_count/len(data)*100:.1f}%)")
-                logger.info(f"   O/U 1.5 odds: {ou15_count}/{len(data)} ({ou15_count/len(data)*100:.1f}%)")
-                logger.info(f"   O/U 4.5 odds: {ou45_count}/{len(data)} ({ou45_count/len(data)*100:.1f}%)")
-                
-                # Show a comprehensive sample
-                if data:
-                    sample = data[0]
-                    sample_odds = sample.get('odds', {})
-                    logger.info("\\n📝 Sample comprehensive entry:")
-                    logger.info(f"Event: {sample['home_team']} vs {sample['away_team']}")
-                    logger.info(f"1X2: [{sample_odds.get('home_odds')}, {sample_odds.get('draw_odds')}, {sample_odds.get('away_odds')}]")
-                    logger.info(f"BTTS: Yes {sample_odds.get('btts_yes')}, No {sample_odds.get('btts_no')}")
-                    logger.info(f"O/U 2.5: Over {sample_odds.get('over_25')}, Under {sample_odds.get('under_25')}")
-                    logger.info(f"O/U 3.5: Over {sample_odds.get('over_35')}, Under {sample_odds.get('under_35')}")
-                    if sample_odds.get('over_15'):
-                        logger.info(f"O/U 1.5: Over {sample_odds.get('over_15')}, Under {sample_odds.get('under_15')}")
-                    if sample_odds.get('over_45'):
-                        logger.info(f"O/U 4.5: Over {sample_odds.get('over_45')}, Under {sample_odds.get('under_45')}")
+        if os.getenv("SAVE_JSON"):
+            logger.info("\\n💾 Saving corrected results to JSON...")
+            json_filename = scraper.save_results_to_json("tipp3_btts_ou_corrected_results.json")
+            if json_filename:
+                logger.info(f"✅ JSON file created: {json_filename}")
         
     except Exception as e:
         logger.error(f"❌ Test failed: {e}")
@@ -152,8 +67,7 @@ async def test_btts_ou_correction():
 
 if __name__ == "__main__":
     # Set up logging
-    logger.remove()
-    logger.add(sys.stderr, level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}")
+    configure_logging()
     
     try:
         asyncio.run(test_btts_ou_correction())
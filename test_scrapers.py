@@ -6,68 +6,72 @@ import asyncio
 import os
 import sys
 from datetime import datetime
+from pathlib import Path
 from loguru import logger
+from playwright.async_api import async_playwright
 
 # Add src to Python path so we can import our modules
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from log_setup import configure_logging
 from scrapers.base_scraper import ScraperManager
 from scrapers.lottoland_scraper import LottolandScraper
 from scrapers.win2day_scraper import Win2DayScraper
 
-# Configure logging
-logger.add("logs/scraper_test.log", rotation="1 day", retention="1 week", level="INFO")
 
-
-async def test_single_scraper(scraper_class, scraper_name):
+async def test_single_scraper(scraper_class, scraper_name, playwright=None):
     """Test a single scraper"""
-    logger.info(f"\n{'='*50}")
-    logger.info(f"Testing {scraper_name} Scraper")
-    logger.info(f"{'='*50}")
+    # Scrapers are tested concurrently, so tag each line with the scraper it belongs to
+    log = logger.patch(lambda record: record.update(message=f"[{scraper_name}] {record['message']}"))
+    
+    log.info(f"\n{'='*50}")
+    log.info(f"Testing {scraper_name} Scraper")
+    log.info(f"{'='*50}")
     
     try:
         scraper = scraper_class()
+        scraper.playwright = playwright
         
         async with scraper:
             # Test getting events
-            logger.info("1. Testing event scraping...")
+            log.info("1. Testing event scraping...")
             events = await scraper.get_football_events()
             
-            logger.info(f"Found {len(events)} events from {scraper_name}")
+            log.info(f"Found {len(events)} events from {scraper_name}")
             
             # Display first few events
             for i, event in enumerate(events[:3]):
-                logger.info(f"Event {i+1}: {event.home_team} vs {event.away_team}")
-                logger.info(f"  Date: {event.match_date}")
-                logger.info(f"  League: {event.league}")
-                logger.info(f"  URL: {event.event_url}")
-                logger.info("")
+                log.info("Event {}: {} vs {}", i+1, event.home_team, event.away_team)
+                log.info("  Date: {}", event.match_date)
+                log.info("  League: {}", event.league)
+                log.info("  URL: {}", event.event_url)
+                log.info("")
             
             # Test getting odds for first event if available
             if events:
-                logger.info("2. Testing odds scraping...")
+                log.info("2. Testing odds scraping...")
                 first_event = events[0]
-                logger.info(f"Getting odds for: {first_event.home_team} vs {first_event.away_team}")
+                log.info(f"Getting odds for: {first_event.home_team} vs {first_event.away_team}")
                 
                 odds = await scraper.get_event_odds(first_event)
                 
                 if odds:
-                    logger.info("Odds found!")
-                    logger.info(f"  Home: {odds.home_odds}")
-                    logger.info(f"  Draw: {odds.draw_odds}")
-                    logger.info(f"  Away: {odds.away_odds}")
+                    log.info("Odds found!")
+                    log.info(f"  Home: {odds.home_odds}")
+                    log.info(f"  Draw: {odds.draw_odds}")
+                    log.info(f"  Away: {odds.away_odds}")
                 else:
-                    logger.warning("No odds found for this event")
+                    log.warning("No odds found for this event")
             else:
-                logger.warning("No events found, skipping odds test")
+                log.warning("No events found, skipping odds test")
                 
     except Exception as e:
-        logger.error(f"Error testing {scraper_name}: {str(e)}")
+        log.error(f"Error testing {scraper_name}: {str(e)}")
         import traceback
-        logger.error(traceback.format_exc())
+        log.error(traceback.format_exc())
 
 
-async def test_scraper_manager():
+async def test_scraper_manager(playwright=None):
     """Test the scraper manager with multiple scrapers"""
     logger.info(f"\n{'='*50}")
     logger.info("Testing Scraper Manager")
@@ -75,36 +79,38 @@ async def test_scraper_manager():
     
     try:
         # Create scraper manager and register scrapers
-        manager = ScraperManager()
+        manager = ScraperManager(playwright=playwright)
         manager.register_scraper(LottolandScraper())
         manager.register_scraper(Win2DayScraper())
         
-        # Test scraping events from all scrapers
-        logger.info("Scraping events from all registered scrapers...")
-        all_events = await manager.scrape_all_events()
-        
-        for bookmaker, events in all_events.items():
-            logger.info(f"{bookmaker}: {len(events)} events")
-        
-        # Find common events (if any) for odds comparison
-        if all(len(events) > 0 for events in all_events.values()):
-            logger.info("Testing odds comparison...")
-            
-            # Take first event from first bookmaker
-            first_bookmaker = list(all_events.keys())[0]
-            test_event = all_events[first_bookmaker][0]
-            
-            logger.info(f"Comparing odds for: {test_event.home_team} vs {test_event.away_team}")
+        # Keep every scraper's browser warm for both the event and the odds pass
+        async with manager:
+            # Test scraping events from all scrapers
+            logger.info("Scraping events from all registered scrapers...")
+            all_events = await manager.scrape_all_events()
             
-            # Get odds from all scrapers for this event
-            all_odds = await manager.scrape_odds_for_event(test_event)
+            for bookmaker, events in all_events.items():
+                logger.info(f"{bookmaker}: {len(events)} events")
             
-            logger.info("Odds comparison:")
-            for bookmaker, odds in all_odds.items():
-                if odds:
-                    logger.info(f"  {bookmaker}: {odds.home_odds}-{odds.draw_odds}-{odds.away_odds}")
-                else:
-                    logger.info(f"  {bookmaker}: No odds found")
+            # Find common events (if any) for odds comparison
+            if all(len(events) > 0 for events in all_events.values()):
+                logger.info("Testing odds comparison...")
+                
+                # Take first event from first bookmaker
+                first_bookmaker = list(all_events.keys())[0]
+                test_event = all_events[first_bookmaker][0]
+                
+                logger.info(f"Comparing odds for: {test_event.home_team} vs {test_event.away_team}")
+                
+                # Get odds from all scrapers for this event
+                all_odds = await manager.scrape_odds_for_event(test_event)
+                
+                logger.info("Odds comparison:")
+                for bookmaker, odds in all_odds.items():
+                    if odds:
+                        logger.info(f"  {bookmaker}: {odds.home_odds}-{odds.draw_odds}-{odds.away_odds}")
+                    else:
+                        logger.info(f"  {bookmaker}: No odds found")
         
     except Exception as e:
         logger.error(f"Error testing scraper manager: {str(e)}")
@@ -120,29 +126,38 @@ async def main():
     # Create logs directory if it doesn't exist
     os.makedirs("logs", exist_ok=True)
     
-    # Test individual scrapers
-    await test_single_scraper(Win2DayScraper, "win2day")
-    await test_single_scraper(LottolandScraper, "Lottoland")
-    
-    # Test scraper manager
-    await test_scraper_manager()
+    # Every browser below is launched from one Playwright driver instead of one per scraper
+    async with async_playwright() as playwright:
+        # Test individual scrapers concurrently; they hit different hosts with their own browsers
+        await asyncio.gather(
+            test_single_scraper(Win2DayScraper, "win2day", playwright),
+            test_single_scraper(LottolandScraper, "Lottoland", playwright)
+        )
+        
+        # Test scraper manager
+        await test_scraper_manager(playwright)
     
     logger.info(f"\nAll tests completed at: {datetime.now()}")
 
 
 if __name__ == "__main__":
-    # Install Playwright browsers if not already installed
-    logger.info("Ensuring Playwright browsers are installed...")
-    try:
-        from playwright.async_api import async_playwright
-        # This will ensure browsers are downloaded
-        import subprocess
-        result = subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            logger.warning(f"Playwright install warning: {result.stderr}")
-    except Exception as e:
-        logger.warning(f"Could not check Playwright installation: {e}")
+    configure_logging(file="logs/scraper_test.log")
+    
+    # Install Playwright browsers once per machine; the marker skips the install on later runs
+    playwright_marker = Path.home() / ".cache" / "odds_checker" / "playwright_ok"
+    if not os.getenv("SKIP_PLAYWRIGHT_INSTALL") and not playwright_marker.exists():
+        logger.info("Ensuring Playwright browsers are installed...")
+        try:
+            import subprocess
+            result = subprocess.run([sys.executable, "-m", "playwright", "install", "chromium"],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                logger.warning(f"Playwright install warning: {result.stderr}")
+            else:
+                playwright_marker.parent.mkdir(parents=True, exist_ok=True)
+                playwright_marker.touch()
+        except Exception as e:
+            logger.warning(f"Could not check Playwright installation: {e}")
     
     # Run the tests
     asyncio.run(main())
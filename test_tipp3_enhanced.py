@@ -2,17 +2,35 @@
 Test script for the enhanced tipp3 scraper that identifies bet types and saves to JSON
 """
 import asyncio
+import json
 import sys
 import os
+from collections import Counter
+from itertools import islice
 from pathlib import Path
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json parser is used instead
+    orjson = None
+
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from log_setup import configure_logging
+from markets import MARKETS, count_markets, log_markets, log_sample_markets
 from scrapers.tipp3_enhanced_scraper import Tipp3EnhancedScraper
 
 
+def iter_results(ndjson_filename: str):
+    """Yield the events of a results NDJSON file, with orjson when it is installed"""
+    loads = orjson.loads if orjson else json.loads
+    with open(ndjson_filename, 'rb') as f:
+        for line in f:
+            yield loads(line)
+
+
 async def test_tipp3_enhanced_scraper():
     """Test the enhanced tipp3 scraper with bet type identification and JSON export"""
     logger.info("🚀 Testing Enhanced Tipp3 Scraper with Bet Type Identification...")
@@ -36,108 +54,97 @@ async def test_tipp3_enhanced_scraper():
             # Display detailed analysis of first few events
             logger.info("\n🔍 Detailed Odds Analysis:")
             for i, event in enumerate(events[:5]):
-                logger.info(f"\n--- Event {i+1}: {event.home_team} vs {event.away_team} ---")
+                logger.info("\n--- Event {}: {} vs {} ---", i+1, event.home_team, event.away_team)
                 
-                if hasattr(event, 'enhanced_odds_data'):
+                if event.enhanced_odds_data:
                     odds_data = event.enhanced_odds_data
                     
                     # Display raw odds for debugging
-                    logger.info(f"Raw odds count: {odds_data.get('raw_odds_count', 0)}")
-                    logger.info(f"Raw odds sample: {odds_data.get('raw_odds_sample', [])}")
+                    logger.info("Raw odds count: {}", odds_data.get('raw_odds_count', 0))
+                    logger.info("Raw odds sample: {}", odds_data.get('raw_odds_sample', []))
                     
                     # Display identified bet types
-                    logger.info(f"🎯 1X2 Odds: {odds_data.get('home_odds')} - {odds_data.get('draw_odds')} - {odds_data.get('away_odds')}")
-                    
-                    if odds_data.get('btts_yes'):
-                        logger.info(f"⚽ BTTS: Yes {odds_data.get('btts_yes')}, No {odds_data.get('btts_no')}")
-                    
-                    if odds_data.get('over_25'):
-                        logger.info(f"📈 O/U 2.5: Over {odds_data.get('over_25')}, Under {odds_data.get('under_25')}")
-                    
-                    if odds_data.get('over_35'):
-                        logger.info(f"📊 O/U 3.5: Over {odds_data.get('over_35')}, Under {odds_data.get('under_35')}")
+                    log_markets(odds_data)
                     
-                    if odds_data.get('exact_scores'):
-                        logger.info(f"🎲 Exact Scores: {len(odds_data.get('exact_scores', {}))} found")
+                    exact_scores = odds_data.get('exact_scores')
+                    if exact_scores:
+                        logger.info("🎲 Exact Scores: {} found", len(exact_scores))
                         # Show first few exact scores
-                        for score, odds in list(odds_data.get('exact_scores', {}).items())[:3]:
-                            logger.info(f"   {score}: {odds}")
+                        for score, odds in islice(exact_scores.items(), 3):
+                            logger.info("   {}: {}", score, odds)
                 
                 # Test odds extraction
                 odds = await scraper.get_event_odds(event)
                 if odds:
-                    logger.info(f"✅ ScrapedOdds created successfully")
-                    logger.info(f"   Enhanced attributes available: BTTS={bool(odds.btts_yes)}, O/U 2.5={bool(odds.over_25)}, Exact={len(getattr(odds, 'exact_scores', {}))}")
+                    logger.info("✅ ScrapedOdds created successfully")
+                    logger.info("   Enhanced attributes available: BTTS={}, O/U 2.5={}, Exact={}", bool(odds.btts_yes), bool(odds.over_25), len(odds.exact_scores))
                 else:
-                    logger.warning(f"❌ Could not create ScrapedOdds")
+                    logger.warning("❌ Could not create ScrapedOdds")
         
-        # Save results to JSON
-        logger.info("\n💾 Saving results to JSON...")
-        json_filename = scraper.save_results_to_json()
+        # Save results as NDJSON (save_results_to_json is the legacy full-array writer);
+        # later saves to the same file only append the events scraped since
+        logger.info("\n💾 Saving results to NDJSON...")
+        ndjson_filename = scraper.save_results_to_ndjson()
         
-        if json_filename and os.path.exists(json_filename):
-            logger.info(f"✅ JSON file created: {json_filename}")
+        try:
+            file_size = os.stat(ndjson_filename).st_size if ndjson_filename else None
+        except OSError:
+            file_size = None
+        
+        if file_size is not None:
+            logger.info(f"✅ NDJSON file created: {ndjson_filename}")
             
             # Show file size and first entry preview
-            file_size = os.path.getsize(json_filename)
             logger.info(f"📁 File size: {file_size:,} bytes")
             
-            # Quick preview of JSON content
-            import json
-            with open(json_filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Quick preview of NDJSON content
+            data = list(iter_results(ndjson_filename))
             
             if data:
-                logger.info(f"📋 JSON contains {len(data)} event entries")
-                logger.info("\n📝 Sample JSON entry:")
+                logger.info(f"📋 NDJSON contains {len(data)} event entries")
+                logger.info("\n📝 Sample NDJSON entry:")
                 sample_entry = data[0]
                 logger.info(f"Event: {sample_entry['home_team']} vs {sample_entry['away_team']}")
                 logger.info(f"League: {sample_entry['league']}")
                 
                 sample_odds = sample_entry.get('odds', {})
-                logger.info(f"1X2: [{sample_odds.get('home_odds')}, {sample_odds.get('draw_odds')}, {sample_odds.get('away_odds')}]")
-                logger.info(f"BTTS: Yes {sample_odds.get('btts_yes')}, No {sample_odds.get('btts_no')}")
-                logger.info(f"O/U 2.5: Over {sample_odds.get('over_25')}, Under {sample_odds.get('under_25')}")
+                log_sample_markets(sample_odds)
                 logger.info(f"Exact scores: {len(sample_odds.get('exact_scores', {}))}")
         
-        # Test with multiple leagues
+        # Test with multiple leagues; the Austrian Bundesliga results are still in the
+        # results buffer, so only the Premier League has to be scraped on top
         logger.info("\n🌍 Testing with Premier League as well...")
-        all_leagues = ["Austrian Bundesliga", "Premier League"]  
-        
-        # Reset results for multi-league test
-        scraper.scraped_results = []
         
-        all_events = await scraper.get_football_events(leagues=all_leagues)
+        pl_events = await scraper.get_football_events(leagues=["Premier League"])
+        all_events = events + pl_events
         logger.info(f"📊 Total events from both leagues: {len(all_events)}")
         
-        # Save combined results
-        combined_json = scraper.save_results_to_json("tipp3_combined_results.json")
-        if combined_json:
-            logger.info(f"✅ Combined results saved to: {combined_json}")
+        # Append the Premier League events to the same file
+        combined_ndjson = scraper.save_results_to_ndjson(ndjson_filename)
+        if combined_ndjson:
+            logger.info(f"✅ Combined results saved to: {combined_ndjson}")
             
-            # Final summary
-            with open(combined_json, 'r', encoding='utf-8') as f:
-                combined_data = json.load(f)
+            # Final summary in one streaming pass over the file: the league tally is
+            # taken while count_markets consumes the events
+            leagues_count = Counter()
             
-            logger.info(f"\n📈 Final Summary:")
-            logger.info(f"   Total events: {len(combined_data)}")
+            def tally_leagues():
+                for entry in iter_results(combined_ndjson):
+                    leagues_count[entry['league']] += 1
+                    yield entry
             
-            leagues_count = {}
-            for entry in combined_data:
-                league = entry['league']
-                leagues_count[league] = leagues_count.get(league, 0) + 1
+            counts = count_markets(tally_leagues())
             
-            for league, count in leagues_count.items():
-                logger.info(f"   {league}: {count} events")
+            logger.info(f"\n📈 Final Summary:")
+            logger.info(f"   Total events: {leagues_count.total()}")
             
-            # Count how many have each bet type
-            btts_count = sum(1 for entry in combined_data if entry['odds'].get('btts_yes'))
-            ou25_count = sum(1 for entry in combined_data if entry['odds'].get('over_25'))
-            exact_count = sum(1 for entry in combined_data if entry['odds'].get('exact_scores'))
+            for league, count in leagues_count.most_common():
+                logger.info(f"   {league}: {count} events")
             
-            logger.info(f"   Events with BTTS odds: {btts_count}")
-            logger.info(f"   Events with O/U 2.5 odds: {ou25_count}")
-            logger.info(f"   Events with exact score odds: {exact_count}")
+            # Events with each bet type
+            for label, _, _ in MARKETS:
+                logger.info(f"   Events with {label} odds: {counts[label]}")
+            logger.info(f"   Events with exact score odds: {counts['Correct Score']}")
         
     except Exception as e:
         logger.error(f"❌ Test failed: {e}")
@@ -150,8 +157,7 @@ async def test_tipp3_enhanced_scraper():
 
 if __name__ == "__main__":
     # Set up logging
-    logger.remove()
-    logger.add(sys.stderr, level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}")
+    configure_logging()
     
     try:
         asyncio.run(test_tipp3_enhanced_scraper())
@@ -2,16 +2,27 @@
 Test script for the fixed tipp3 scraper
 """
 import asyncio
+import mmap
 import sys
-import os
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, Optional
 from loguru import logger
+from lxml import etree, html as lxml_html
 
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
+from log_setup import configure_logging
 from scrapers.tipp3_fixed_scraper import Tipp3FixedScraper
 
+_HTML_PARSER = lxml_html.HTMLParser()
+
+# Compiled once and evaluated by lxml; counting in XPath avoids building element lists
+_COUNT_EVENT_LINKS = etree.XPath("count(//a[contains(@href, 'eventdetails') and contains(@href, 'eventID=')])")
+_COUNT_PLAYER_LINKS = etree.XPath("count(//a[contains(concat(' ', normalize-space(@class), ' '), ' t3-list-entry__player ')])")
+_COUNT_BET_BUTTONS = etree.XPath("count(//button[contains(translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'bet')])")
+
 
 async def test_tipp3_fixed_scraper():
     """Test the fixed tipp3 scraper functionality"""
@@ -35,12 +46,13 @@ async def test_tipp3_fixed_scraper():
         if events:
             # Display first few events
             logger.info("\n🎯 Sample Events:")
+            # One log record per event
             for i, event in enumerate(events[:5]):
-                logger.info(f"{i+1}. {event.home_team} vs {event.away_team}")
-                logger.info(f"   League: {event.league}")
-                logger.info(f"   Event ID: {event.bookmaker_event_id}")
-                logger.info(f"   URL: {event.event_url}")
-                logger.info("")
+                logger.info(
+                    "{}. {} vs {}\n   League: {}\n   Event ID: {}\n   URL: {}\n",
+                    i+1, event.home_team, event.away_team, event.league,
+                    event.bookmaker_event_id, event.event_url
+                )
             
             # Test odds extraction for the first event
             if len(events) > 0:
@@ -55,11 +67,11 @@ async def test_tipp3_fixed_scraper():
                     logger.info(f"   Draw: {odds.draw_odds}")
                     logger.info(f"   Away: {odds.away_odds}")
                     
-                    if hasattr(odds, 'btts_yes') and odds.btts_yes:
+                    if odds.btts_yes:
                         logger.info(f"   BTTS Yes: {odds.btts_yes}")
-                    if hasattr(odds, 'over_25') and odds.over_25:
+                    if odds.over_25:
                         logger.info(f"   Over 2.5: {odds.over_25}")
-                    if hasattr(odds, 'exact_scores') and odds.exact_scores:
+                    if odds.exact_scores:
                         logger.info(f"   Exact Scores: {len(odds.exact_scores)} found")
                 else:
                     logger.warning("❌ No odds extracted")
@@ -74,10 +86,8 @@ async def test_tipp3_fixed_scraper():
         logger.info(f"📊 Total events from all leagues: {len(all_events)}")
         
         # Group events by league
-        events_by_league = {}
+        events_by_league = defaultdict(list)
         for event in all_events:
-            if event.league not in events_by_league:
-                events_by_league[event.league] = []
             events_by_league[event.league].append(event)
         
         for league, league_events in events_by_league.items():
@@ -92,54 +102,65 @@ async def test_tipp3_fixed_scraper():
         logger.info("🧹 Cleanup completed")
 
 
+def _analyze_html_file(html_file: Path) -> Optional[Dict[str, int]]:
+    """Count event links, team links and bet buttons in a saved HTML file, or None if it is missing or empty"""
+    try:
+        f = open(html_file, 'rb')
+    except FileNotFoundError:
+        return None
+    
+    # lxml parses (and decodes) straight from the memory-mapped file, without a bytes copy
+    with f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return None
+        with mapped:
+            tree = etree.fromstring(mapped, parser=_HTML_PARSER)
+    return {
+        'Event detail links': int(_COUNT_EVENT_LINKS(tree)),
+        'Player/Team links': int(_COUNT_PLAYER_LINKS(tree)),
+        'Betting buttons': int(_COUNT_BET_BUTTONS(tree)),
+    }
+
+
 async def test_structure_analysis():
     """Quick structure analysis of saved HTML files"""
     
     logger.info("🔍 Analyzing saved HTML structure...")
     
-    # Check for saved HTML files
-    html_files = [
-        "tipp3_austrian_bundesliga.html",
-        "tipp3_main_page.html"
-    ]
+    # Every saved tipp3 page, found with one directory scan
+    html_files = sorted(Path('.').glob('tipp3_*.html'))
     
-    for html_file in html_files:
-        if os.path.exists(html_file):
-            logger.info(f"📄 Analyzing {html_file}...")
-            
-            with open(html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Quick analysis
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(content, 'html.parser')
-            
-            # Look for event links
-            event_links = soup.find_all('a', href=lambda x: x and 'eventdetails' in x and 'eventID=' in x)
-            logger.info(f"   Event detail links found: {len(event_links)}")
-            
-            # Look for team name links
-            player_links = soup.find_all('a', class_=lambda x: x and 't3-list-entry__player' in ' '.join(x))
-            logger.info(f"   Player/Team links found: {len(player_links)}")
-            
-            # Look for betting buttons
-            bet_buttons = soup.find_all('button', class_=lambda x: x and 'bet' in ' '.join(x).lower())
-            logger.info(f"   Betting buttons found: {len(bet_buttons)}")
-            
-            logger.info("")
+    # Files are read and parsed in worker threads; lxml releases the GIL while parsing
+    results = await asyncio.gather(*(asyncio.to_thread(_analyze_html_file, html_file) for html_file in html_files))
+    
+    for html_file, counts in zip(html_files, results):
+        if counts is None:
+            continue
+        
+        logger.info(f"📄 Analyzed {html_file}...")
+        for label, count in counts.items():
+            logger.info(f"   {label} found: {count}")
+        
+        logger.info("")
+
+
+async def run_all():
+    """Run every test in this script on one event loop"""
+    # Run structure analysis first
+    await test_structure_analysis()
+    
+    # Then test the scraper
+    await test_tipp3_fixed_scraper()
 
 
 if __name__ == "__main__":
     # Set up logging
-    logger.remove()
-    logger.add(sys.stderr, level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}")
+    configure_logging()
     
     try:
-        # Run structure analysis first
-        asyncio.run(test_structure_analysis())
-        
-        # Then test the scraper
-        asyncio.run(test_tipp3_fixed_scraper())
+        asyncio.run(run_all())
         
         logger.info("🎉 All tests completed!")
         
@@ -4,16 +4,26 @@ Test script for tipp3 real scraper targeting specific league URLs
 import asyncio
 import os
 import sys
+from collections import defaultdict
 from datetime import datetime
+from itertools import islice
 from loguru import logger
 
 # Add src to Python path so we can import our modules
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from log_setup import configure_logging
+from markets import format_market
 from scrapers.tipp3_real_scraper import Tipp3RealScraper
 
-# Configure logging
-logger.add("logs/tipp3_test.log", rotation="1 day", retention="1 week", level="DEBUG")
+# Priority leagues scraped at the same time
+_LEAGUE_CONCURRENCY = 3
+
+# Detail events whose odds the all-leagues test extracts
+_ODDS_PROBE_SIZE = 5
+
+# Persistent cache of fetched event pages, reused by reruns within its TTL (pass --no-cache to bypass)
+_HTTP_CACHE_PATH = "logs/tipp3_http_cache.sqlite"
 
 
 async def test_specific_league(scraper, league_name):
@@ -23,112 +33,107 @@ async def test_specific_league(scraper, league_name):
     logger.info(f"{'='*60}")
     
     try:
-        async with scraper:
-            # Get events from specific league
-            events = await scraper.get_football_events([league_name])
-            
-            logger.info(f"Found {len(events)} events in {league_name}")
+        # Get events from specific league
+        events = await scraper.get_football_events([league_name])
+        
+        logger.info(f"Found {len(events)} events in {league_name}")
+        
+        if events:
+            # Display first few events
+            # One log record per event
+            for i, event in enumerate(events[:3]):
+                logger.info(
+                    "\nEvent {}: {} vs {}\n  Date: {}\n  League: {}\n  Event URL: {}\n  Event ID: {}",
+                    i+1, event.home_team, event.away_team, event.match_date, event.league,
+                    event.event_url, event.bookmaker_event_id
+                )
             
-            if events:
-                # Display first few events
-                for i, event in enumerate(events[:3]):
-                    logger.info(f"\nEvent {i+1}: {event.home_team} vs {event.away_team}")
-                    logger.info(f"  Date: {event.match_date}")
-                    logger.info(f"  League: {event.league}")
-                    logger.info(f"  Event URL: {event.event_url}")
-                    logger.info(f"  Event ID: {event.bookmaker_event_id}")
+            # Try to get detailed odds for first event
+            if events[0].event_url and 'eventdetails' in events[0].event_url:
+                logger.info(f"\n{'*'*40}")
+                logger.info("Testing detailed odds extraction")
+                logger.info(f"{'*'*40}")
                 
-                # Try to get detailed odds for first event
-                if events[0].event_url and 'eventdetails' in events[0].event_url:
-                    logger.info(f"\n{'*'*40}")
-                    logger.info("Testing detailed odds extraction")
-                    logger.info(f"{'*'*40}")
-                    
-                    first_event = events[0]
-                    logger.info(f"Getting odds for: {first_event.home_team} vs {first_event.away_team}")
-                    logger.info(f"Event URL: {first_event.event_url}")
+                first_event = events[0]
+                logger.info(f"Getting odds for: {first_event.home_team} vs {first_event.away_team}")
+                logger.info(f"Event URL: {first_event.event_url}")
+                
+                odds = await scraper.get_event_odds(first_event)
+                
+                if odds:
+                    logger.info("✅ Successfully extracted odds!")
+                    logger.info(f"1X2 Odds: {odds.home_odds} - {odds.draw_odds} - {odds.away_odds}")
                     
-                    odds = await scraper.get_event_odds(first_event)
+                    # Check for the additional markets ScrapedOdds declares
+                    for label, outcomes, values in (
+                        ("BTTS", ("Yes", "No"), (odds.btts_yes, odds.btts_no)),
+                        ("O/U 2.5", ("Over", "Under"), (odds.over_25, odds.under_25)),
+                        ("O/U 3.5", ("Over", "Under"), (odds.over_35, odds.under_35)),
+                    ):
+                        if values[0]:
+                            logger.info(f"{label}: {format_market(outcomes, values)}")
                     
-                    if odds:
-                        logger.info("✅ Successfully extracted odds!")
-                        logger.info(f"1X2 Odds: {odds.home_odds} - {odds.draw_odds} - {odds.away_odds}")
-                        
-                        # Check for additional odds
-                        if hasattr(odds, 'btts_yes') and odds.btts_yes:
-                            logger.info(f"BTTS: Yes {odds.btts_yes}, No {getattr(odds, 'btts_no', 'N/A')}")
-                        
-                        if hasattr(odds, 'over_25') and odds.over_25:
-                            logger.info(f"O/U 2.5: Over {odds.over_25}, Under {getattr(odds, 'under_25', 'N/A')}")
-                        
-                        if hasattr(odds, 'over_35') and odds.over_35:
-                            logger.info(f"O/U 3.5: Over {odds.over_35}, Under {getattr(odds, 'under_35', 'N/A')}")
-                        
-                        if hasattr(odds, 'exact_scores') and odds.exact_scores:
-                            logger.info(f"Exact scores found: {len(odds.exact_scores)} different scores")
-                            for score, score_odds in list(odds.exact_scores.items())[:5]:  # Show first 5
-                                logger.info(f"  {score}: {score_odds}")
-                    else:
-                        logger.warning("❌ No odds extracted")
+                    if odds.exact_scores:
+                        logger.info(f"Exact scores found: {len(odds.exact_scores)} different scores")
+                        for score, score_odds in islice(odds.exact_scores.items(), 5):  # Show first 5
+                            logger.info(f"  {score}: {score_odds}")
                 else:
-                    logger.warning("No event detail URL found for odds extraction")
+                    logger.warning("❌ No odds extracted")
             else:
-                logger.warning("No events found in this league")
-                
+                logger.warning("No event detail URL found for odds extraction")
+        else:
+            logger.warning("No events found in this league")
+            
     except Exception as e:
         logger.error(f"Error testing {league_name}: {str(e)}")
         import traceback
         logger.error(traceback.format_exc())
 
 
-async def test_all_leagues():
+async def test_all_leagues(scraper):
     """Test all available leagues"""
     logger.info(f"\n{'='*60}")
     logger.info("Testing ALL leagues")
     logger.info(f"{'='*60}")
     
-    scraper = Tipp3RealScraper()
-    
     try:
-        async with scraper:
-            # Get events from all leagues
-            all_events = await scraper.get_football_events()
-            
-            logger.info(f"Total events found across all leagues: {len(all_events)}")
-            
-            # Group events by league
-            leagues = {}
-            for event in all_events:
-                if event.league not in leagues:
-                    leagues[event.league] = []
-                leagues[event.league].append(event)
+        # Get events from all leagues
+        all_events = await scraper.get_football_events()
+        
+        logger.info(f"Total events found across all leagues: {len(all_events)}")
+        
+        # Group events by league
+        leagues = defaultdict(list)
+        for event in all_events:
+            leagues[event.league].append(event)
+        
+        # Show summary by league
+        for league, events in leagues.items():
+            logger.info(f"{league}: {len(events)} events")
             
-            # Show summary by league
-            for league, events in leagues.items():
-                logger.info(f"{league}: {len(events)} events")
-                
-                # Show first event from each league
-                if events:
-                    first_event = events[0]
-                    logger.info(f"  Example: {first_event.home_team} vs {first_event.away_team}")
+            # Show first event from each league
+            if events:
+                first_event = events[0]
+                logger.info(f"  Example: {first_event.home_team} vs {first_event.away_team}")
+        
+        # Test odds extraction on the first few events with a detail URL
+        detail_events = [e for e in all_events if e.event_url and 'eventdetails' in e.event_url]
+        
+        if detail_events:
+            logger.info(f"\nTesting odds extraction on {len(detail_events)} events with detail URLs")
             
-            # Test odds extraction on first available event with detail URL
-            detail_events = [e for e in all_events if e.event_url and 'eventdetails' in e.event_url]
+            # Probed concurrently; the scraper's fetch slots and host pacing bound the requests
+            probe_events = detail_events[:_ODDS_PROBE_SIZE]
+            all_odds = await asyncio.gather(*(scraper.get_event_odds(event) for event in probe_events))
             
-            if detail_events:
-                logger.info(f"\nTesting odds extraction on {len(detail_events)} events with detail URLs")
-                
-                # Test first event with detail URL
-                test_event = detail_events[0]
+            for test_event, odds in zip(probe_events, all_odds):
                 logger.info(f"Testing odds for: {test_event.home_team} vs {test_event.away_team}")
-                
-                odds = await scraper.get_event_odds(test_event)
                 if odds:
                     logger.info("✅ Odds extraction successful!")
                     logger.info(f"Basic odds: {odds.home_odds} - {odds.draw_odds} - {odds.away_odds}")
                 else:
                     logger.warning("❌ Odds extraction failed")
-                    
+                
     except Exception as e:
         logger.error(f"Error in comprehensive test: {str(e)}")
         import traceback
@@ -150,16 +155,26 @@ async def main():
         "German Bundesliga"     # Close to Austria, popular
     ]
     
-    logger.info("Testing priority leagues individually...")
-    
-    for league in priority_leagues:
-        scraper = Tipp3RealScraper()
-        await test_specific_league(scraper, league)
-        await asyncio.sleep(2)  # Brief pause between tests
+    # One scraper (and browser) serves every league test below
+    scraper = Tipp3RealScraper()
+    if "--no-cache" not in sys.argv:
+        scraper.http_cache_path = _HTTP_CACHE_PATH
     
-    # Test all leagues together
-    logger.info("\nTesting comprehensive scraping...")
-    await test_all_leagues()
+    async with scraper:
+        logger.info("Testing priority leagues individually...")
+        
+        # Leagues are tested concurrently; the semaphore caps how many scrape tipp3 at once
+        league_slots = asyncio.Semaphore(_LEAGUE_CONCURRENCY)
+        
+        async def run_league(league):
+            async with league_slots:
+                await test_specific_league(scraper, league)
+        
+        await asyncio.gather(*(run_league(league) for league in priority_leagues))
+        
+        # Test all leagues together
+        logger.info("\nTesting comprehensive scraping...")
+        await test_all_leagues(scraper)
     
     logger.info(f"\n{'='*60}")
     logger.info("All tipp3 tests completed!")
@@ -169,4 +184,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    configure_logging(level="DEBUG", file="logs/tipp3_test.log")
     asyncio.run(main())
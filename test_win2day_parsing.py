@@ -0,0 +1,74 @@
+"""
+Pure-function checks of win2day team-name cleanup and date parsing, runnable without a browser
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from bs4 import BeautifulSoup
+from loguru import logger
+
+# Add the src directory to Python path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from log_setup import configure_logging
+from scrapers.win2day_scraper import Win2DayScraper
+
+
+def parse_row(text: str):
+    """Run a single event row through the win2day container parser"""
+    container = BeautifulSoup(f"<div>{text}</div>", 'lxml').div
+    return asyncio.run(Win2DayScraper()._parse_event_container(container))
+
+
+def test_odds_are_not_read_as_dates():
+    """Decimal odds like 2.10 must leave the date at the default (tomorrow)"""
+    event = parse_row("Rapid Wien - Sturm Graz 2.10 3.40 3.25")
+    assert event is not None
+    assert event.home_team == "Rapid"
+    assert event.match_date.date() == (datetime.now() + timedelta(days=1)).date()
+
+
+def test_short_dates_with_odds():
+    """DD.MM. and DD/MM dates are parsed even when odds follow in the same row"""
+    for text in ("24.12. Rapid Wien - Sturm Graz 2.10 3.40", "24/12 Rapid Wien - Sturm Graz 2.10 3.40"):
+        event = parse_row(text)
+        assert event is not None, text
+        assert event.home_team == "Rapid", text
+        assert (event.match_date.month, event.match_date.day) == (12, 24), text
+        assert event.match_date.year == datetime.now().year, text
+
+
+def test_full_date_with_odds():
+    """A DD.MM.YYYY date is stripped from the team name as a whole and parsed with its year"""
+    event = parse_row("24.12.2027 Rapid Wien - Sturm Graz 2.10 3.40")
+    assert event is not None
+    assert event.home_team == "Rapid"
+    assert event.match_date == datetime(2027, 12, 24)
+
+
+def test_team_names_have_no_noise():
+    """Times, dates and odds never survive in the parsed team names"""
+    for text in ("18:30 Rapid Wien - Sturm 1.85", "01.08.25 LASK - Salzburg 4.20", "Austria - WAC 2.05 3.10"):
+        event = parse_row(text)
+        assert event is not None, text
+        for name in (event.home_team, event.away_team):
+            assert not any(ch.isdigit() for ch in name), text
+            assert name == name.strip(" .-/:"), text
+
+
+if __name__ == "__main__":
+    configure_logging()
+    
+    tests = [value for name, value in list(globals().items()) if name.startswith("test_")]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            logger.info("✅ {}", test.__name__)
+        except AssertionError as e:
+            failed += 1
+            logger.error("❌ {}: {}", test.__name__, e)
+    
+    logger.info("{}/{} checks passed", len(tests) - failed, len(tests))
+    sys.exit(1 if failed else 0)
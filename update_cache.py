@@ -3,30 +3,52 @@
 Automated cache updater for Austrian 2. Liga
 This can be run periodically (e.g., every 10-15 minutes) to keep data fresh
 """
-import subprocess
+import asyncio
+import signal
 import sys
 import time
 from datetime import datetime
 
+from fetch_austrian_2liga_cache import fetch_austrian_2liga_data
+
+# Seconds between the starts of two updates in continuous mode
+UPDATE_INTERVAL = 600
+
 def run_cache_update():
-    """Run the cache update script"""
+    """Run the cache update in-process (the fetch requests carry their own timeouts)"""
     try:
         print(f"[{datetime.now()}] Starting cache update...")
-        result = subprocess.run([sys.executable, 'fetch_austrian_2liga_cache.py'], 
-                              capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0:
-            print(f"[{datetime.now()}] Cache update successful!")
-            print(result.stdout)
-        else:
-            print(f"[{datetime.now()}] Cache update failed!")
-            print(f"Error: {result.stderr}")
+        fetch_austrian_2liga_data()
+        print(f"[{datetime.now()}] Cache update successful!")
             
-    except subprocess.TimeoutExpired:
-        print(f"[{datetime.now()}] Cache update timed out!")
     except Exception as e:
         print(f"[{datetime.now()}] Cache update error: {e}")
 
+async def run_continuously():
+    """Run the cache update every UPDATE_INTERVAL seconds until SIGINT or SIGTERM"""
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows event loops; Ctrl+C still raises KeyboardInterrupt
+            pass
+    
+    while not stop.is_set():
+        started = time.monotonic()
+        # The fetch uses blocking requests, so it runs in a worker thread
+        await asyncio.to_thread(run_cache_update)
+        
+        # Sleep for the rest of the interval, so a slow update doesn't push back the schedule
+        remaining = max(0, UPDATE_INTERVAL - (time.monotonic() - started))
+        print(f"[{datetime.now()}] Waiting {remaining:.0f}s before next update...")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=remaining)
+        except TimeoutError:
+            pass
+    
+    print(f"\n[{datetime.now()}] Cache updater stopped")
+
 if __name__ == '__main__':
     # For testing, run once
     if len(sys.argv) > 1 and sys.argv[1] == '--continuous':
@@ -35,10 +57,7 @@ if __name__ == '__main__':
         print("Press Ctrl+C to stop")
         
         try:
-            while True:
-                run_cache_update()
-                print(f"[{datetime.now()}] Waiting 10 minutes before next update...")
-                time.sleep(600)  # 10 minutes
+            asyncio.run(run_continuously())
         except KeyboardInterrupt:
             print(f"\n[{datetime.now()}] Cache updater stopped by user")
     else: